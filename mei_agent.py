@@ -1,36 +1,87 @@
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse, JSONResponse
-from pydantic import BaseModel
-from typing import Dict, List, Optional
-import json
+from fastapi.responses import HTMLResponse, ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field, asdict
+import asyncio
+import functools
+import hashlib
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
 import os
-from groq import Groq
+import re
+import time
+from types import MappingProxyType
+import httpx
+import orjson
+from cachetools import LRUCache, TTLCache
+from groq import AsyncGroq
 from mock_leads_data import get_lead_context, get_contextual_quick_replies, get_all_leads
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Mei AI Agent - StoreHub Lead Qualification")
+app = FastAPI(
+    title="Mei AI Agent - StoreHub Lead Qualification",
+    default_response_class=ORJSONResponse
+)
 
-# Mount static files and templates
-app.mount("/static", StaticFiles(directory="static"), name="static")
-templates = Jinja2Templates(directory="templates")
+# Mount static files; API-only workers can skip them with SERVE_STATIC=0
+if os.getenv("SERVE_STATIC", "1") == "1":
+    app.mount("/static", StaticFiles(directory="static"), name="static")
 
-# Initialize Groq client
+@functools.lru_cache(maxsize=1)
+def _templates():
+    """Jinja2 templates, built on first HTML request so API-only workers never load them"""
+    from fastapi.templating import Jinja2Templates
+    return Jinja2Templates(directory="templates")
+
+# Initialize Groq client. HTTP/2 keeps one multiplexed connection and HPACK-compresses
+# headers; Groq does not document gzip request bodies, so the prompt is sent uncompressed.
 groq_client = None
 if os.getenv("GROQ_API_KEY"):
-    groq_client = Groq(api_key=os.getenv("GROQ_API_KEY"))
+    groq_client = AsyncGroq(
+        api_key=os.getenv("GROQ_API_KEY"),
+        http_client=httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=100),
+            timeout=httpx.Timeout(30.0, connect=5.0)
+        )
+    )
     logger.info("✅ Groq API configured for Mei agent")
 else:
     logger.warning("⚠️ Groq API not configured - using mock responses")
 
-# Lead qualification status structure
-class LeadStatus(BaseModel):
+@app.on_event("shutdown")
+async def _close_groq_client():
+    """Close pooled Groq connections when the worker stops"""
+    if groq_client:
+        await groq_client.close()
+
+# Upper bound on concurrent Groq requests so bursts queue here instead of hitting 429s
+GROQ_SEM = asyncio.Semaphore(int(os.getenv("GROQ_MAX_CONCURRENCY", "20")))
+
+async def groq_completion(**kwargs):
+    """Create a Groq chat completion under the shared concurrency limit"""
+    async with GROQ_SEM:
+        return await groq_client.chat.completions.create(**kwargs)
+
+async def groq_stream(**kwargs):
+    """Yield text deltas from a streamed Groq completion, holding the concurrency slot until it ends"""
+    async with GROQ_SEM:
+        async for chunk in await groq_client.chat.completions.create(stream=True, **kwargs):
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+# Groq model for Mei; override to A/B against other served variants
+MEI_MODEL = os.getenv("MEI_MODEL", "llama-3.1-8b-instant")
+
+# Lead qualification status structure (internal per-turn state, kept as plain
+# slotted dataclasses so no validation runs on every append)
+@dataclass(slots=True)
+class LeadStatus:
     mql: bool = False
     sql: bool = False
     schedule: bool = False
@@ -52,37 +103,135 @@ class LeadStatus(BaseModel):
     purchase_timeline: str = ""
     meeting_type: str = ""
 
-class ChatMessage(BaseModel):
+@dataclass(slots=True)
+class ChatMessage:
     role: str  # "user" or "assistant"
     content: str
-    timestamp: datetime
+    timestamp: float  # unix seconds
+    prompt_line: str = field(init=False, repr=False)  # "User: ..." / "Mei: ..." history line
+    serialized: Dict = field(init=False, repr=False)  # /api/session representation
+    
+    def __post_init__(self):
+        speaker = "User" if self.role == "user" else "Mei"
+        self.prompt_line = f"{speaker}: {self.content}\n"
+        self.serialized = {
+            "role": self.role,
+            "content": self.content,
+            "timestamp": datetime.fromtimestamp(self.timestamp).isoformat()
+        }
 
 class ChatRequest(BaseModel):
     session_id: str
     message: str
     lead_id: Optional[str] = None
 
-class ChatSession(BaseModel):
+# Serialises a list of lead statuses in one pass for /api/sessions
+_LEAD_STATUS_LIST = TypeAdapter(List[LeadStatus])
+
+class QuickReplies(BaseModel):
+    replies: List[str] = Field(min_length=3)
+
+@dataclass(slots=True)
+class ChatSession:
     session_id: str
     lead_status: LeadStatus
-    conversation_history: List[ChatMessage]
     created_at: datetime
     updated_at: datetime
+    conversation_history: List[ChatMessage] = field(default_factory=list)
+    lead_id: Optional[str] = None  # Lead whose context is rendered into lead_context_section
+    lead_context_section: str = ""  # Rendered when the session's lead is first seen or changes
+    running_summary: str = ""  # Summary of messages compacted out of conversation_history
+    summary_pending: bool = False
+
+# Canonical names for locations recognised in user messages. The values are
+# shared constants, so every session references the same string objects.
+LOCATION_NAMES = {
+    "kl": "Kuala Lumpur",
+    "kuala lumpur": "Kuala Lumpur",
+    "selangor": "Selangor",
+    "penang": "Penang",
+    "johor": "Johor",
+}
+_LOCATION_RE = re.compile(r"\b(kuala lumpur|kl|selangor|penang|johor)\b", re.IGNORECASE)
+
+# Keyword matchers for update_lead_status, run case-insensitively on the raw message
+_FNB_RE = re.compile(r"restaurant|cafe|f&b|food|beverage", re.IGNORECASE)
+_RETAIL_RE = re.compile(r"retail|shop|store|boutique", re.IGNORECASE)
+_NEW_BUSINESS_RE = re.compile(r"new business|starting|opening soon", re.IGNORECASE)
+_EXISTING_BUSINESS_RE = re.compile(r"existing|currently operating|been running", re.IGNORECASE)
+_DECISION_MAKER_RE = re.compile(r"owner|manage|director", re.IGNORECASE)
+
+# Character budget for conversation history in the system prompt (~1000 tokens)
+HISTORY_BUDGET_CHARS = 4096
+
+# Once a session holds more than HISTORY_MAX_MESSAGES, the oldest
+# HISTORY_COMPACT_MESSAGES are folded into the session's running summary
+HISTORY_MAX_MESSAGES = 20
+HISTORY_COMPACT_MESSAGES = 10
+
+# In-memory storage for demo (in production, use proper database). Sessions idle
+# for MEI_SESSION_TTL seconds are evicted; every turn re-inserts its session to
+# refresh the TTL. The store is per process, so MEI_WORKERS > 1 needs sticky sessions.
+chat_sessions: TTLCache = TTLCache(
+    maxsize=int(os.getenv("MEI_MAX_SESSIONS", "10000")),
+    ttl=int(os.getenv("MEI_SESSION_TTL", "1800"))
+)
+
+# Per-process cache of lead context lookups
+_LEAD_CTX_CACHE: TTLCache = TTLCache(maxsize=2048, ttl=60)
+
+async def get_lead_context_cached(lead_id: str) -> Optional[Dict]:
+    """get_lead_context with a 60 second TTL cache in front of it.
 
-# In-memory storage for demo (in production, use proper database)
-chat_sessions: Dict[str, ChatSession] = {}
+    Cache hits are served on the event loop; misses run in a worker thread so a
+    slow lead source doesn't stall other requests.
+    """
+    context = _LEAD_CTX_CACHE.get(lead_id)
+    if context is None:
+        context = await asyncio.to_thread(get_lead_context, lead_id)
+        _LEAD_CTX_CACHE[lead_id] = context
+    return context
 
-# Mock calendar availability
-def get_mock_availability(start_date: str, end_date: str) -> List[Dict]:
+# Quick replies generated by Groq, keyed on Mei's message and the lead profile.
+# Scripted openings recur across sessions, so exact matches skip the LLM call.
+_QUICK_REPLY_CACHE: LRUCache = LRUCache(maxsize=4096)
+
+def _quick_reply_key(mei_message: str, lead_context: Optional[Dict]) -> str:
+    business_intel = lead_context["business_intel"] if lead_context else {}
+    raw = "\x1f".join((
+        mei_message.strip().lower(),
+        business_intel.get("business_type", ""),
+        business_intel.get("location", ""),
+    ))
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+# In-flight Mei turns keyed by session and message, so retries share one Groq call
+_inflight_responses: Dict[str, asyncio.Future] = {}
+
+# In-flight quick-reply generations keyed like _QUICK_REPLY_CACHE
+_inflight_quick_replies: Dict[str, asyncio.Future] = {}
+
+async def _single_flight(inflight: Dict[str, asyncio.Future], key: str, factory):
+    """Run factory() once per key; concurrent callers with the same key await the same task"""
+    task = inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(factory())
+        inflight[key] = task
+        task.add_done_callback(lambda _: inflight.pop(key, None))
+    return await asyncio.shield(task)
+
+# Mock calendar availability (static, so built once and shared read-only)
+_AVAILABILITY = tuple(MappingProxyType(slot) for slot in [
+    {"date": "2024-12-20", "time": "9:30 AM", "available": True},
+    {"date": "2024-12-20", "time": "2:00 PM", "available": True},
+    {"date": "2024-12-21", "time": "10:00 AM", "available": True},
+    {"date": "2024-12-21", "time": "3:30 PM", "available": True},
+    {"date": "2024-12-22", "time": "11:00 AM", "available": True},
+])
+
+def get_mock_availability(start_date: str, end_date: str) -> Tuple[MappingProxyType, ...]:
     """Mock function to simulate calendar availability"""
-    available_slots = [
-        {"date": "2024-12-20", "time": "9:30 AM", "available": True},
-        {"date": "2024-12-20", "time": "2:00 PM", "available": True},
-        {"date": "2024-12-21", "time": "10:00 AM", "available": True},
-        {"date": "2024-12-21", "time": "3:30 PM", "available": True},
-        {"date": "2024-12-22", "time": "11:00 AM", "available": True},
-    ]
-    return available_slots
+    return _AVAILABILITY
 
 def book_mock_meeting(date: str, time: str, meeting_type: str) -> bool:
     """Mock function to simulate meeting booking"""
@@ -117,43 +266,9 @@ def format_lead_status_for_prompt(lead_status: LeadStatus) -> str:
    current_datetime: {current_time}
    """
 
-def get_mei_system_prompt(lead_status: LeadStatus, conversation_history: List[ChatMessage], lead_id: Optional[str] = None) -> str:
-    """Generate the complete system prompt for Mei with current status and lead context"""
-    
-    lead_status_section = format_lead_status_for_prompt(lead_status)
-    
-    # Get lead context if available
-    lead_context_section = ""
-    if lead_id:
-        context = get_lead_context(lead_id)
-        if context:
-            business_intel = context["business_intel"]
-            ad_context = context["ad_context"] 
-            lead_data = context["lead_data"]
-            
-            lead_context_section = f"""
-    
-    <lead_context>
-    IMPORTANT: This conversation is with {business_intel.get('business_type', 'unknown business')} called {lead_data['company_name']}.
-    They clicked on our '{ad_context.get('title', 'StoreHub')}' ad and are likely interested in {ad_context.get('focus', 'our services')}.
-    
-    Known business information:
-    - Company: {lead_data['company_name']}
-    - Business Type: {business_intel.get('business_type', 'Unknown')}
-    - Location: {business_intel.get('location', 'Malaysia')}
-    - Likely Pain Points: {', '.join(business_intel.get('pain_points', []))}
-    - Ad Context: {context['personalized_context']}
-    
-    Use this context to personalize your responses and ask relevant follow-up questions.
-    </lead_context>"""
-    
-    # Format conversation history
-    history_text = ""
-    for msg in conversation_history[-10:]:  # Last 10 messages for context
-        role = "User" if msg.role == "user" else "Mei"
-        history_text += f"{role}: {msg.content}\n"
-    
-    system_prompt = f"""# AI Agent Instructions: Mei from StoreHub
+# Static sections of Mei's system prompt, split around the per-turn values so
+# each turn only concatenates precomputed text
+_PROMPT_HEAD = """# AI Agent Instructions: Mei from StoreHub
 
 ## 1. Your Identity & Goal
 
@@ -168,9 +283,13 @@ This is your complete operating manual. You must adhere to every rule, persona t
 
     
    <lead_qualification_status>
-   {lead_status_section}
+   """
+
+_PROMPT_STATUS_CLOSE = """
    </lead_qualification_status>
-   {lead_context_section}
+   """
+
+_PROMPT_BODY = """
     
     
     OBJECTIVES: 
@@ -373,39 +492,161 @@ This is your complete operating manual. You must adhere to every rule, persona t
 ---
 
 ## Previous Conversation:
-{history_text}
+"""
+
+_PROMPT_TAIL = """
 
 ## Your Task:
 Based on the current lead qualification status and conversation history, generate Mei's next response. Follow the logic in your ROOT_AGENT_INSTR strictly. Your response should ONLY contain what Mei would say to the user - no additional commentary or analysis.
 """
+
+# Anonymous chats have no <lead_context> block, so the status close and body fuse
+_ANON_PROMPT_BODY = _PROMPT_STATUS_CLOSE + _PROMPT_BODY
+
+def _render_lead_context_section(context: Dict) -> str:
+    """Render the <lead_context> prompt block for a lead"""
+    business_intel = context["business_intel"]
+    ad_context = context["ad_context"] 
+    lead_data = context["lead_data"]
+    
+    return f"""
     
-    return system_prompt
+    <lead_context>
+    IMPORTANT: This conversation is with {business_intel.get('business_type', 'unknown business')} called {lead_data['company_name']}.
+    They clicked on our '{ad_context.get('title', 'StoreHub')}' ad and are likely interested in {ad_context.get('focus', 'our services')}.
+    
+    Known business information:
+    - Company: {lead_data['company_name']}
+    - Business Type: {business_intel.get('business_type', 'Unknown')}
+    - Location: {business_intel.get('location', 'Malaysia')}
+    - Likely Pain Points: {', '.join(business_intel.get('pain_points', []))}
+    - Ad Context: {context['personalized_context']}
+    
+    Use this context to personalize your responses and ask relevant follow-up questions.
+    </lead_context>"""
 
-async def generate_mei_response(session: ChatSession, user_message: str, lead_id: Optional[str] = None) -> str:
-    """Generate Mei's response using the AI model"""
+def _prompt_anon(lead_status_section: str, history_text: str) -> str:
+    """System prompt for chats without lead context"""
+    return "".join((_PROMPT_HEAD, lead_status_section, _ANON_PROMPT_BODY, history_text, _PROMPT_TAIL))
+
+def _prompt_with_lead(lead_status_section: str, lead_context_section: str, history_text: str) -> str:
+    """System prompt for chats personalised with lead context"""
+    return "".join((
+        _PROMPT_HEAD, lead_status_section, _PROMPT_STATUS_CLOSE,
+        lead_context_section, _PROMPT_BODY, history_text, _PROMPT_TAIL
+    ))
+
+def get_mei_system_prompt(session: ChatSession) -> str:
+    """Generate the complete system prompt for Mei with current status and lead context"""
+    
+    lead_status_section = format_lead_status_for_prompt(session.lead_status)
+    
+    summary_line = f"Earlier summary: {session.running_summary}\n" if session.running_summary else ""
+    
+    # Format conversation history, newest first, until the character budget is spent
+    budget = HISTORY_BUDGET_CHARS - len(summary_line)
+    history_lines = []
+    for msg in reversed(session.conversation_history):
+        if len(msg.prompt_line) > budget:
+            break
+        history_lines.append(msg.prompt_line)
+        budget -= len(msg.prompt_line)
+    history_lines.append(summary_line)
+    history_text = "".join(reversed(history_lines))
+    
+    if session.lead_context_section:
+        return _prompt_with_lead(lead_status_section, session.lead_context_section, history_text)
+    return _prompt_anon(lead_status_section, history_text)
+
+async def generate_mei_response(session: ChatSession, user_message: str) -> str:
+    """Generate Mei's response, sharing one turn between duplicate deliveries of the same message"""
+    digest = hashlib.blake2b(user_message.encode(), digest_size=8).hexdigest()
+    return await _single_flight(
+        _inflight_responses,
+        f"{session.session_id}:{digest}",
+        lambda: _generate_mei_response(session, user_message)
+    )
+
+# Background summarisation tasks, referenced so they aren't garbage collected mid-run
+_background_tasks: set = set()
+
+def _compact_history(session: ChatSession):
+    """Summarise the oldest messages of a long history in the background.
+
+    The messages stay in conversation_history (and so in the prompt) until
+    their summary lands; _summarize_history removes them only on success.
+    """
+    if not groq_client or session.summary_pending:
+        return
+    if len(session.conversation_history) <= HISTORY_MAX_MESSAGES:
+        return
+    
+    compacted = session.conversation_history[:HISTORY_COMPACT_MESSAGES]
+    session.summary_pending = True
+    task = asyncio.get_running_loop().create_task(_summarize_history(session, compacted))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+async def _summarize_history(session: ChatSession, messages: List[ChatMessage]):
+    """Fold messages into session.running_summary, then drop them from the history.
+
+    On failure the messages are kept, so the next long turn retries the summary.
+    """
+    previous = f"Summary so far: {session.running_summary}\n\n" if session.running_summary else ""
+    transcript = "".join(msg.prompt_line for msg in messages)
+    try:
+        response = await groq_completion(
+            model=MEI_MODEL,
+            messages=(
+                {
+                    "role": "system",
+                    "content": "Summarise this sales conversation in under 80 words. Keep every fact the business owner shared (business type, location, role, needs, timeline) and any meeting details."
+                },
+                {"role": "user", "content": previous + transcript}
+            ),
+            temperature=0.2,
+            max_tokens=150
+        )
+        session.running_summary = response.choices[0].message.content.strip()
+        # Only appends happen while summary_pending is set, so the prefix is unchanged
+        del session.conversation_history[:len(messages)]
+    except Exception as e:
+        logger.warning(f"Failed to summarise history for session {session.session_id}: {e}")
+    finally:
+        session.summary_pending = False
+
+async def _begin_mei_turn(session: ChatSession, user_message: str):
+    """Record the user's message and update lead status ahead of Mei's reply"""
+    
+    _compact_history(session)
     
     # Add user message to conversation history
     session.conversation_history.append(
-        ChatMessage(role="user", content=user_message, timestamp=datetime.now())
+        ChatMessage(role="user", content=user_message, timestamp=time.time())
     )
     session.lead_status.responsecount += 1
     
     # Update lead status based on conversation analysis (simplified logic)
     await update_lead_status(session, user_message)
+
+async def _generate_mei_response(session: ChatSession, user_message: str) -> str:
+    """Generate Mei's response using the AI model"""
+    
+    await _begin_mei_turn(session, user_message)
     
     if not groq_client:
         # Fallback mock response for demo
         return generate_mock_mei_response(session, user_message)
     
     try:
-        system_prompt = get_mei_system_prompt(session.lead_status, session.conversation_history, lead_id)
+        system_prompt = get_mei_system_prompt(session)
         
-        response = groq_client.chat.completions.create(
-            model="llama3-8b-8192",  # Switched to smaller, more efficient model
-            messages=[
+        response = await groq_completion(
+            model=MEI_MODEL,
+            messages=(
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_message}
-            ],
+            ),
             temperature=0.6,  # Reduced temperature for more consistent responses
             max_tokens=300    # Reduced token count to save on rate limits
         )
@@ -414,7 +655,7 @@ async def generate_mei_response(session: ChatSession, user_message: str, lead_id
         
         # Add Mei's response to conversation history
         session.conversation_history.append(
-            ChatMessage(role="assistant", content=mei_response, timestamp=datetime.now())
+            ChatMessage(role="assistant", content=mei_response, timestamp=time.time())
         )
         
         return mei_response
@@ -424,29 +665,64 @@ async def generate_mei_response(session: ChatSession, user_message: str, lead_id
         # Better fallback with more human-like responses
         fallback_response = generate_mock_mei_response(session, user_message)
         session.conversation_history.append(
-            ChatMessage(role="assistant", content=fallback_response, timestamp=datetime.now())
+            ChatMessage(role="assistant", content=fallback_response, timestamp=time.time())
         )
         return fallback_response
 
+async def stream_mei_response(session: ChatSession, user_message: str):
+    """Yield Mei's response in pieces as Groq produces them, then store the full text"""
+    
+    await _begin_mei_turn(session, user_message)
+    
+    if not groq_client:
+        # Fallback mock response for demo, sent as a single piece
+        yield generate_mock_mei_response(session, user_message)
+        return
+    
+    parts: List[str] = []
+    try:
+        async for delta in groq_stream(
+            model=MEI_MODEL,
+            messages=(
+                {"role": "system", "content": get_mei_system_prompt(session)},
+                {"role": "user", "content": user_message}
+            ),
+            temperature=0.6,
+            max_tokens=300
+        ):
+            parts.append(delta)
+            yield delta
+    except Exception as e:
+        logger.error(f"Error streaming Mei response: {e}")
+        if not parts:
+            fallback_response = generate_mock_mei_response(session, user_message)
+            parts.append(fallback_response)
+            yield fallback_response
+    
+    # Add Mei's response to conversation history once the stream ends
+    session.conversation_history.append(
+        ChatMessage(role="assistant", content="".join(parts).strip(), timestamp=time.time())
+    )
+
 async def update_lead_status(session: ChatSession, user_message: str):
     """Update lead status based on conversation analysis"""
-    message_lower = user_message.lower()
     
     # Simple keyword-based status updates (in production, use more sophisticated analysis)
-    if any(word in message_lower for word in ["restaurant", "cafe", "f&b", "food", "beverage"]):
+    if _FNB_RE.search(user_message):
         session.lead_status.business_type = "F&B"
-    elif any(word in message_lower for word in ["retail", "shop", "store", "boutique"]):
+    elif _RETAIL_RE.search(user_message):
         session.lead_status.business_type = "Retail"
     
-    if any(word in message_lower for word in ["new business", "starting", "opening soon"]):
+    if _NEW_BUSINESS_RE.search(user_message):
         session.lead_status.business_status = "New"
-    elif any(word in message_lower for word in ["existing", "currently operating", "been running"]):
+    elif _EXISTING_BUSINESS_RE.search(user_message):
         session.lead_status.business_status = "Existing"
     
-    if any(word in message_lower for word in ["kl", "kuala lumpur", "selangor", "penang", "johor"]):
-        session.lead_status.business_location = message_lower
+    location_match = _LOCATION_RE.search(user_message)
+    if location_match:
+        session.lead_status.business_location = LOCATION_NAMES[location_match.group(1).lower()]
     
-    if any(word in message_lower for word in ["owner", "manage", "director"]):
+    if _DECISION_MAKER_RE.search(user_message):
         session.lead_status.user_role = "Decision Maker"
     
     # Basic MQL determination
@@ -461,110 +737,102 @@ async def update_lead_status(session: ChatSession, user_message: str):
         session.lead_status.responsecount >= 4):
         session.lead_status.sql = True
 
+# Scripted Mei turns used when the AI is not available
+MOCK_MEI_RESPONSES = (
+    "Hi there! I'm Mei from StoreHub. I'd love to learn more about your business. Are you running an existing business or planning to start a new one?",
+    "That sounds interesting! What type of business are you in - F&B, retail, or something else?",
+    "Great! Where is your business located? This helps me understand how we can best support you.",
+    "I understand. Are you the owner or manager of the business? It's important for me to speak with the decision maker.",
+    "Perfect! Based on what you've shared, I think StoreHub could be a great fit for your business. Would you be interested in a quick demo to see how our POS system works?",
+    "Excellent! Let me check some available time slots for a demo. Would you prefer a face-to-face meeting or online demo?"
+)
+
+# Quick replies for each scripted turn, so those turns never need a Groq call
+SCRIPTED_QUICK_REPLIES: Dict[str, Tuple[str, ...]] = dict(zip(MOCK_MEI_RESPONSES, (
+    ("I have an existing business", "Planning to start one", "Just exploring options"),
+    ("F&B business", "Retail store", "Something else"),
+    ("Kuala Lumpur", "Penang", "Johor Bahru"),
+    ("I'm the owner", "I'm the manager", "I'm a staff member"),
+    ("Yes, show me a demo", "How much does it cost?", "Maybe later"),
+    ("Face-to-face meeting", "Online demo is fine", "What times are free?"),
+)))
+
 def generate_mock_mei_response(session: ChatSession, user_message: str) -> str:
     """Generate mock responses when AI is not available"""
-    responses = [
-        "Hi there! I'm Mei from StoreHub. I'd love to learn more about your business. Are you running an existing business or planning to start a new one?",
-        "That sounds interesting! What type of business are you in - F&B, retail, or something else?",
-        "Great! Where is your business located? This helps me understand how we can best support you.",
-        "I understand. Are you the owner or manager of the business? It's important for me to speak with the decision maker.",
-        "Perfect! Based on what you've shared, I think StoreHub could be a great fit for your business. Would you be interested in a quick demo to see how our POS system works?",
-        "Excellent! Let me check some available time slots for a demo. Would you prefer a face-to-face meeting or online demo?"
-    ]
-    
-    response_index = min(session.lead_status.responsecount - 1, len(responses) - 1)
-    return responses[response_index]
+    response_index = min(session.lead_status.responsecount - 1, len(MOCK_MEI_RESPONSES) - 1)
+    return MOCK_MEI_RESPONSES[response_index]
+
+# Quick-reply prompt scaffolding, built once at import
+QUICK_REPLY_TEMPLATE = (
+    "Mei: {mei_message}\n"
+    "Customer profile: {business_type}/{location}\n"
+    'Return JSON {{"replies": [a, b, c]}}, each 3-6 words, answering Mei as the business owner.'
+)
+QUICK_REPLY_SYSTEM_MSG = {
+    "role": "system",
+    "content": "You are a helpful assistant that generates contextual quick reply options for business conversations. Always respond with a JSON object holding exactly 3 options under \"replies\"."
+}
 
-async def generate_dynamic_quick_replies(mei_message: str, user_message: str, conversation_history: List[ChatMessage], lead_id: Optional[str] = None) -> List[str]:
-    """Generate contextual quick replies using LLM based on conversation flow"""
+async def generate_dynamic_quick_replies(mei_message: str, lead_id: Optional[str] = None, lead_context: Optional[Dict] = None) -> Tuple[str, ...]:
+    """Generate contextual quick replies using LLM based on Mei's latest message.
+
+    ``lead_context`` is the already-fetched context for ``lead_id``, so the caller's
+    lookup is reused rather than repeated here.
+    """
+    
+    scripted = SCRIPTED_QUICK_REPLIES.get(mei_message)
+    if scripted is not None:
+        return scripted
     
     if not groq_client:
         # Fallback to pre-determined logic if Groq is not available
         return get_contextual_quick_replies(lead_id, mei_message)
-    
-    try:
-        # Get lead context for additional information
-        lead_context = ""
-        if lead_id:
-            context = get_lead_context(lead_id)
-            if context:
-                business_intel = context["business_intel"]
-                lead_context = f"""
-Lead Context:
-- Company: {context['lead_data']['company_name']}
-- Business Type: {business_intel.get('business_type', 'Unknown')}
-- Location: {business_intel.get('location', 'Unknown')}
-- Pain Points: {', '.join(business_intel.get('pain_points', []))}
-"""
-
-        # Build conversation context
-        recent_history = ""
-        if conversation_history:
-            recent_messages = conversation_history[-4:]  # Last 4 messages for context
-            for msg in recent_messages:
-                recent_history += f"{msg.role}: {msg.content}\n"
-
-        # Create prompt for generating quick replies
-        quick_reply_prompt = f"""Generate 3 quick reply options for a business owner responding to Mei's last message in this sales conversation.
 
-{lead_context}
-
-Recent Conversation:
-{recent_history}
-User: {user_message}
-Mei: {mei_message}
-
-Create 3 quick replies that:
-• Answer what Mei just asked specifically
-• Sound natural for a business owner to say
-• Are concise (3-6 words ideal)
-• Move the conversation forward
-• Match the business context
+    cache_key = _quick_reply_key(mei_message, lead_context)
+    cached = _QUICK_REPLY_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    # Concurrent requests for the same message and profile share one Groq call
+    quick_replies = await _single_flight(
+        _inflight_quick_replies,
+        cache_key,
+        lambda: _request_quick_replies(mei_message, lead_id, lead_context, cache_key)
+    )
+    return quick_replies
 
-Return as JSON array only: ["Reply 1", "Reply 2", "Reply 3"]"""
+async def _request_quick_replies(mei_message: str, lead_id: Optional[str], lead_context: Optional[Dict], cache_key: str) -> Tuple[str, ...]:
+    """Ask Groq for quick replies, caching valid results and falling back to scripted logic"""
+    try:
+        # Mei's latest message is the signal; the lead profile keeps replies in character
+        business_intel = lead_context["business_intel"] if lead_context else {}
+        quick_reply_prompt = QUICK_REPLY_TEMPLATE.format_map({
+            "mei_message": mei_message,
+            "business_type": business_intel.get("business_type", "Unknown"),
+            "location": business_intel.get("location", "Unknown")
+        })
 
-        # Make API call to generate quick replies with smaller model
-        response = groq_client.chat.completions.create(
-            model="llama3-8b-8192",  # Switched to smaller model
-            messages=[
-                {
-                    "role": "system", 
-                    "content": "You are a helpful assistant that generates contextual quick reply options for business conversations. Always respond with exactly 3 options in valid JSON array format."
-                },
-                {
-                    "role": "user",
-                    "content": quick_reply_prompt
-                }
-            ],
+        # Make API call to generate quick replies without blocking the event loop
+        response = await groq_completion(
+            model=MEI_MODEL,
+            messages=(
+                QUICK_REPLY_SYSTEM_MSG,
+                {"role": "user", "content": quick_reply_prompt}
+            ),
             temperature=0.5,  # Lower temperature for more consistent JSON
-            max_tokens=100    # Reduced token count
+            max_tokens=60,    # Three short replies in JSON mode
+            response_format={"type": "json_object"}
         )
         
         # Parse the response
         reply_content = response.choices[0].message.content.strip()
         
-        # Try to parse as JSON
-        import json
         try:
-            quick_replies = json.loads(reply_content)
-            if isinstance(quick_replies, list) and len(quick_replies) >= 3:
-                return quick_replies[:3]  # Ensure exactly 3 replies
-        except json.JSONDecodeError:
-            logger.warning(f"Failed to parse LLM quick replies as JSON: {reply_content}")
-        
-        # If parsing fails, extract replies from text
-        lines = reply_content.split('\n')
-        replies = []
-        for line in lines:
-            line = line.strip()
-            if line and (line.startswith('"') or line.startswith('-') or line.startswith('•')):
-                # Clean up the line
-                clean_line = line.replace('"', '').replace('-', '').replace('•', '').strip()
-                if clean_line and len(replies) < 3:
-                    replies.append(clean_line)
-        
-        if len(replies) >= 3:
-            return replies[:3]
+            quick_replies = tuple(QuickReplies.model_validate_json(reply_content).replies[:3])  # Ensure exactly 3 replies
+            _QUICK_REPLY_CACHE[cache_key] = quick_replies
+            return quick_replies
+        except ValidationError:
+            logger.warning(f"LLM quick replies did not match the JSON schema: {reply_content}")
             
     except Exception as e:
         logger.error(f"Error generating dynamic quick replies: {e}")
@@ -577,7 +845,55 @@ Return as JSON array only: ["Reply 1", "Reply 2", "Reply 3"]"""
 @app.get("/", response_class=HTMLResponse)
 async def get_mei_chat_interface(request: Request):
     """Serve the main chat interface"""
-    return templates.TemplateResponse("mei_chat.html", {"request": request})
+    return _templates().TemplateResponse("mei_chat.html", {"request": request})
+
+def _apply_lead_context(session: ChatSession, lead_id: Optional[str], lead_context: Optional[Dict]):
+    """Seed the session's lead status and render its <lead_context> block for lead_id"""
+    session.lead_id = lead_id
+    session.lead_context_section = ""
+    if lead_context:
+        business_intel = lead_context["business_intel"]
+        session.lead_status.business_type = business_intel.get("business_type", "")
+        session.lead_status.business_location = business_intel.get("location", "")
+        session.lead_context_section = _render_lead_context_section(lead_context)
+
+def get_or_create_session(session_id: str, lead_id: Optional[str], lead_context: Optional[Dict]) -> ChatSession:
+    """Return the chat session for session_id, creating it (seeded from the lead) if needed.
+
+    The lead context is rendered once per lead; a turn that arrives with a
+    different lead_id re-renders it and re-seeds the lead status fields.
+    """
+    session = chat_sessions.get(session_id)
+    if session is None:
+        session = ChatSession(
+            session_id=session_id,
+            lead_status=LeadStatus(),
+            created_at=datetime.now(),
+            updated_at=datetime.now()
+        )
+        _apply_lead_context(session, lead_id, lead_context)
+        chat_sessions[session_id] = session
+        logger.info(f"🆕 Chat session {session_id} created ({len(chat_sessions)} active)")
+    elif session.lead_id != lead_id:
+        _apply_lead_context(session, lead_id, lead_context)
+    
+    session.updated_at = datetime.now()
+    chat_sessions[session_id] = session  # Refresh idle TTL
+    return session
+
+def _turn_summary(session: ChatSession, quick_replies: Tuple[str, ...], lead_context: Optional[Dict]) -> Dict:
+    """Fields returned alongside Mei's response at the end of a chat turn"""
+    return {
+        "lead_status": asdict(session.lead_status),
+        "quick_replies": quick_replies,
+        "lead_context": lead_context,
+        "session_info": {
+            "total_messages": len(session.conversation_history),
+            "mql_status": session.lead_status.mql,
+            "sql_status": session.lead_status.sql,
+            "meeting_scheduled": session.lead_status.ms
+        }
+    }
 
 @app.post("/api/chat")
 async def chat_endpoint(chat_request: ChatRequest):
@@ -590,74 +906,81 @@ async def chat_endpoint(chat_request: ChatRequest):
         if not message.strip():
             raise HTTPException(status_code=400, detail="Message cannot be empty")
         
-        # Get or create chat session
-        if session_id not in chat_sessions:
-            # Initialize lead status with context if available
-            lead_status = LeadStatus()
-            if lead_id:
-                context = get_lead_context(lead_id)
-                if context:
-                    business_intel = context["business_intel"]
-                    lead_status.business_type = business_intel.get("business_type", "")
-                    lead_status.business_location = business_intel.get("location", "")
-            
-            chat_sessions[session_id] = ChatSession(
-                session_id=session_id,
-                lead_status=lead_status,
-                conversation_history=[],
-                created_at=datetime.now(),
-                updated_at=datetime.now()
-            )
+        # Fetch lead context once and share it across this request
+        lead_context = await get_lead_context_cached(lead_id) if lead_id else None
         
-        session = chat_sessions[session_id]
-        session.updated_at = datetime.now()
+        session = get_or_create_session(session_id, lead_id, lead_context)
         
         # Generate Mei's response with lead context
-        mei_response = await generate_mei_response(session, message, lead_id)
+        mei_response = await generate_mei_response(session, message)
         
         # Get dynamic quick replies based on the conversation flow
-        quick_replies = await generate_dynamic_quick_replies(mei_response, message, session.conversation_history, lead_id)
+        quick_replies = await generate_dynamic_quick_replies(mei_response, lead_id, lead_context)
         
-        return JSONResponse({
+        return ORJSONResponse({
             "response": mei_response,
-            "lead_status": session.lead_status.dict(),
-            "quick_replies": quick_replies,
-            "lead_context": get_lead_context(lead_id) if lead_id else None,
-            "session_info": {
-                "total_messages": len(session.conversation_history),
-                "mql_status": session.lead_status.mql,
-                "sql_status": session.lead_status.sql,
-                "meeting_scheduled": session.lead_status.ms
-            }
+            **_turn_summary(session, quick_replies, lead_context)
         })
         
     except Exception as e:
         logger.error(f"Chat endpoint error: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             {"error": "Failed to process message"},
             status_code=500
         )
 
+def _sse_frame(event: bytes, data: Dict) -> bytes:
+    """Encode one server-sent event with an orjson payload"""
+    return b"event: " + event + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+
+@app.post("/api/chat/stream")
+async def chat_stream_endpoint(chat_request: ChatRequest):
+    """Stream Mei's reply as server-sent events.
+
+    Each ``token`` event carries a piece of the response as it arrives; a final
+    ``done`` event carries the quick replies and updated lead status.
+    """
+    message = chat_request.message
+    lead_id = chat_request.lead_id
+    
+    if not message.strip():
+        raise HTTPException(status_code=400, detail="Message cannot be empty")
+    
+    lead_context = await get_lead_context_cached(lead_id) if lead_id else None
+    session = get_or_create_session(chat_request.session_id, lead_id, lead_context)
+    
+    async def event_stream():
+        try:
+            parts = []
+            async for delta in stream_mei_response(session, message):
+                parts.append(delta)
+                yield _sse_frame(b"token", {"content": delta})
+            
+            quick_replies = await generate_dynamic_quick_replies("".join(parts).strip(), lead_id, lead_context)
+            summary = _turn_summary(session, quick_replies, lead_context)
+            yield _sse_frame(b"done", summary)
+        except Exception as e:
+            logger.error(f"Chat stream error: {e}")
+            yield _sse_frame(b"error", {"error": "Failed to process message"})
+    
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
 @app.get("/api/session/{session_id}")
-async def get_session_info(session_id: str):
-    """Get session information and conversation history"""
+async def get_session_info(session_id: str, offset: int = Query(0, ge=0), limit: Optional[int] = Query(None, ge=1)):
+    """Get session information and conversation history (paginated with offset/limit)"""
     if session_id not in chat_sessions:
         raise HTTPException(status_code=404, detail="Session not found")
     
     session = chat_sessions[session_id]
+    end = None if limit is None else offset + limit
     return {
         "session_id": session_id,
-        "lead_status": session.lead_status.dict(),
-        "conversation_history": [
-            {
-                "role": msg.role,
-                "content": msg.content,
-                "timestamp": msg.timestamp.isoformat()
-            }
-            for msg in session.conversation_history
-        ],
-        "created_at": session.created_at.isoformat(),
-        "updated_at": session.updated_at.isoformat()
+        "lead_status": asdict(session.lead_status),
+        "running_summary": session.running_summary,
+        "total_messages": len(session.conversation_history),
+        "conversation_history": [msg.serialized for msg in session.conversation_history[offset:end]],
+        "created_at": session.created_at,
+        "updated_at": session.updated_at
     }
 
 @app.post("/api/tools/availability")
@@ -688,13 +1011,15 @@ async def book_meeting(request: Request):
 @app.get("/api/sessions")
 async def list_sessions():
     """List all chat sessions"""
+    sessions = list(chat_sessions.items())  # Snapshot so expiry can't mutate mid-loop
+    lead_statuses = _LEAD_STATUS_LIST.dump_python([session.lead_status for _, session in sessions])
     sessions_data = []
-    for session_id, session in chat_sessions.items():
+    for (session_id, session), lead_status in zip(sessions, lead_statuses):
         sessions_data.append({
             "session_id": session_id,
-            "lead_status": session.lead_status.dict(),
+            "lead_status": lead_status,
             "message_count": len(session.conversation_history),
-            "last_activity": session.updated_at.isoformat(),
+            "last_activity": session.updated_at,
             "business_type": session.lead_status.business_type,
             "mql": session.lead_status.mql,
             "sql": session.lead_status.sql
@@ -706,11 +1031,11 @@ async def list_sessions():
 async def get_mock_leads():
     """Get list of mock leads for selection"""
     try:
-        leads = get_all_leads()
+        leads = await asyncio.to_thread(get_all_leads)
         return {"leads": leads}
     except Exception as e:
         logger.error(f"Error fetching leads: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             {"error": "Failed to fetch leads"},
             status_code=500
         )
@@ -719,7 +1044,7 @@ async def get_mock_leads():
 async def get_lead_details(lead_id: str):
     """Get detailed context for a specific lead"""
     try:
-        context = get_lead_context(lead_id)
+        context = await get_lead_context_cached(lead_id)
         if not context:
             raise HTTPException(status_code=404, detail="Lead not found")
         
@@ -732,11 +1057,20 @@ async def get_lead_details(lead_id: str):
         raise
     except Exception as e:
         logger.error(f"Error fetching lead details: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             {"error": "Failed to fetch lead details"},
             status_code=500
         )
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8001) 
\ No newline at end of file
+    # uvloop event loop + httptools parser; sessions live in process memory,
+    # so only raise MEI_WORKERS behind a sticky-session load balancer
+    uvicorn.run(
+        "mei_agent:app",
+        host="0.0.0.0",
+        port=8001,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("MEI_WORKERS", "1"))
+    )
@@ -10,14 +10,18 @@ Usage:
     python mock_lead_test.py [--scenario SCENARIO_NAME] [--verbose]
 """
 
-import asyncio
-import json
 import time
 import argparse
-from datetime import datetime
-from typing import Dict, List, Any
+import sys
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 import logging
+from collections import Counter, namedtuple
+
+try:
+    import orjson
+except ImportError:  # Fall back to stdlib json for verbose output
+    orjson = None
 
 # Configure logging
 logging.basicConfig(
@@ -26,7 +30,7 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MockLead:
     """Mock lead data structure for testing."""
     lead_id: str
@@ -39,7 +43,7 @@ class MockLead:
     company_size: str
     scenario_type: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MockCompanyData:
     """Mock company intelligence data."""
     domain: str
@@ -47,10 +51,10 @@ class MockCompanyData:
     industry: str
     description: str
     website_content: str
-    news_headlines: List[str]
-    key_characteristics: List[str]
+    news_headlines: Tuple[str, ...]
+    key_characteristics: Tuple[str, ...]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MockContext:
     """Mock lead context data."""
     context_id: str
@@ -60,269 +64,354 @@ class MockContext:
     campaign_type: str
     target_audience: str
 
+# Static mock data shared by every suite instance
+_LEADS: Tuple[MockLead, ...] = (
+    MockLead(
+        lead_id="MOCK_001_TECH_STARTUP",
+        name="Sarah Chen",
+        company="InnovateTech Solutions",
+        email="sarah.chen@innovatetech.com",
+        company_domain="innovatetech.com",
+        context_id="ctx_saas_conversion",
+        industry="Technology",
+        company_size="50-100 employees",
+        scenario_type="saas_prospect"
+    ),
+    MockLead(
+        lead_id="MOCK_002_RETAIL_ENTERPRISE",
+        name="Michael Rodriguez",
+        company="GlobalRetail Corp",
+        email="m.rodriguez@globalretail.com",
+        company_domain="globalretail.com",
+        context_id="ctx_pos_upgrade",
+        industry="Retail",
+        company_size="500+ employees",
+        scenario_type="enterprise_pos"
+    ),
+    MockLead(
+        lead_id="MOCK_003_RESTAURANT_CHAIN",
+        name="Emma Thompson",
+        company="Bella Vista Restaurants",
+        email="emma@bellavista-restaurants.com",
+        company_domain="bellavista-restaurants.com",
+        context_id="ctx_restaurant_efficiency",
+        industry="Food & Beverage",
+        company_size="20-50 employees",
+        scenario_type="restaurant_chain"
+    ),
+    MockLead(
+        lead_id="MOCK_004_HEALTHCARE_CLINIC",
+        name="Dr. James Wilson",
+        company="WellCare Medical Group",
+        email="j.wilson@wellcaremedical.com",
+        company_domain="wellcaremedical.com",
+        context_id="ctx_healthcare_compliance",
+        industry="Healthcare",
+        company_size="10-20 employees",
+        scenario_type="healthcare_specialist"
+    ),
+    MockLead(
+        lead_id="MOCK_005_MANUFACTURING",
+        name="Robert Kim",
+        company="Precision Manufacturing Inc",
+        email="r.kim@precisionmfg.com",
+        company_domain="precisionmfg.com",
+        context_id="ctx_supply_chain",
+        industry="Manufacturing",
+        company_size="200-500 employees",
+        scenario_type="manufacturing_optimization"
+    ),
+    MockLead(
+        lead_id="MOCK_006_ERROR_SCENARIO",
+        name="Test Error",
+        company="Non-Existent Company",
+        email="error@test.com",
+        company_domain="non-existent-domain-12345.com",
+        context_id="ctx_invalid",
+        industry="Testing",
+        company_size="Unknown",
+        scenario_type="error_testing"
+    )
+)
+
+_COMPANY_DATA: Dict[str, MockCompanyData] = {
+    "innovatetech.com": MockCompanyData(
+        domain="innovatetech.com",
+        company_name="InnovateTech Solutions",
+        industry="Technology",
+        description="A leading SaaS provider specializing in workflow automation and productivity tools",
+        website_content="InnovateTech Solutions empowers businesses with cutting-edge automation tools. Our platform integrates seamlessly with existing workflows, providing real-time analytics and intelligent process optimization. Founded in 2018, we serve over 10,000 customers worldwide.",
+        news_headlines=(
+            "InnovateTech raises $15M Series B funding for AI expansion",
+            "New workflow automation features launched for enterprise clients",
+            "Partnership announced with major cloud infrastructure provider"
+        ),
+        key_characteristics=("Cloud-native", "AI-powered", "Enterprise-focused", "Rapid growth")
+    ),
+    "globalretail.com": MockCompanyData(
+        domain="globalretail.com",
+        company_name="GlobalRetail Corp",
+        industry="Retail",
+        description="International retail chain with 500+ locations across North America and Europe",
+        website_content="GlobalRetail Corp operates premium retail stores across multiple categories including fashion, electronics, and home goods. With over 500 locations and 25 years of experience, we focus on delivering exceptional customer experiences through innovative retail technology.",
+        news_headlines=(
+            "GlobalRetail reports 12% growth in Q3 2024 same-store sales",
+            "New omnichannel customer experience platform launched",
+            "Sustainability initiative reduces carbon footprint by 30%"
+        ),
+        key_characteristics=("Multi-location", "Omnichannel", "Customer-centric", "Sustainability focus")
+    ),
+    "bellavista-restaurants.com": MockCompanyData(
+        domain="bellavista-restaurants.com",
+        company_name="Bella Vista Restaurants",
+        industry="Food & Beverage",
+        description="Family-owned restaurant chain known for authentic Italian cuisine and exceptional service",
+        website_content="Bella Vista Restaurants brings authentic Italian flavors to communities across the region. Our 8 locations feature fresh, locally-sourced ingredients and traditional recipes passed down through generations. We pride ourselves on creating memorable dining experiences for families and food enthusiasts.",
+        news_headlines=(
+            "Bella Vista wins 'Best Italian Restaurant' award for third consecutive year",
+            "New location opening in downtown district with enhanced dining experience",
+            "Local sourcing program supports regional farmers and suppliers"
+        ),
+        key_characteristics=("Family-owned", "Authentic cuisine", "Local sourcing", "Community focused")
+    ),
+    "wellcaremedical.com": MockCompanyData(
+        domain="wellcaremedical.com",
+        company_name="WellCare Medical Group",
+        industry="Healthcare",
+        description="Comprehensive medical practice providing primary care and specialized services",
+        website_content="WellCare Medical Group is a patient-centered practice offering comprehensive healthcare services including primary care, preventive medicine, and specialized treatments. Our team of experienced physicians and healthcare professionals is committed to providing personalized, high-quality care in a comfortable environment.",
+        news_headlines=(
+            "WellCare implements new patient portal for enhanced communication",
+            "Telemedicine services expanded to serve rural communities",
+            "Practice achieves NCQA Patient-Centered Medical Home recognition"
+        ),
+        key_characteristics=("Patient-centered", "Technology-enabled", "Comprehensive care", "Quality focused")
+    ),
+    "precisionmfg.com": MockCompanyData(
+        domain="precisionmfg.com",
+        company_name="Precision Manufacturing Inc",
+        industry="Manufacturing",
+        description="Advanced manufacturing company specializing in precision components for aerospace and automotive industries",
+        website_content="Precision Manufacturing Inc is a leader in high-precision component manufacturing, serving the aerospace and automotive industries for over 30 years. Our state-of-the-art facilities and ISO 9001:2015 certification ensure the highest quality standards in every product we deliver.",
+        news_headlines=(
+            "Precision Manufacturing secures major aerospace contract worth $50M",
+            "New automated production line increases capacity by 40%",
+            "Company invests in Industry 4.0 technologies for smart manufacturing"
+        ),
+        key_characteristics=("Precision engineering", "Aerospace certified", "Automated production", "Quality excellence")
+    )
+}
+
+_CONTEXTS: Dict[str, MockContext] = {
+    "ctx_saas_conversion": MockContext(
+        context_id="ctx_saas_conversion",
+        campaign_name="SaaS Workflow Optimization Campaign",
+        source_copy="Transform your business processes with AI-powered workflow automation. Increase productivity by 40% and reduce manual tasks.",
+        landing_page_url="https://ourcompany.com/saas-automation",
+        campaign_type="Digital Ads",
+        target_audience="Tech startups and scale-ups looking to optimize operations"
+    ),
+    "ctx_pos_upgrade": MockContext(
+        context_id="ctx_pos_upgrade",
+        campaign_name="Enterprise POS Modernization",
+        source_copy="Modernize your point-of-sale systems with cloud-based solutions. Real-time inventory, advanced analytics, and seamless integrations.",
+        landing_page_url="https://ourcompany.com/enterprise-pos",
+        campaign_type="LinkedIn Sponsored Content",
+        target_audience="Retail executives and IT decision makers"
+    ),
+    "ctx_restaurant_efficiency": MockContext(
+        context_id="ctx_restaurant_efficiency",
+        campaign_name="Restaurant Operations Excellence",
+        source_copy="Streamline your restaurant operations from order to payment. Reduce wait times, improve accuracy, and enhance customer satisfaction.",
+        landing_page_url="https://ourcompany.com/restaurant-solutions",
+        campaign_type="Industry Publication",
+        target_audience="Restaurant owners and managers"
+    ),
+    "ctx_healthcare_compliance": MockContext(
+        context_id="ctx_healthcare_compliance",
+        campaign_name="Healthcare-Compliant Solutions",
+        source_copy="HIPAA-compliant systems designed for healthcare providers. Secure patient data management with seamless billing integration.",
+        landing_page_url="https://ourcompany.com/healthcare-compliance",
+        campaign_type="Healthcare Trade Show",
+        target_audience="Medical practice administrators and physicians"
+    ),
+    "ctx_supply_chain": MockContext(
+        context_id="ctx_supply_chain",
+        campaign_name="Manufacturing Supply Chain Optimization",
+        source_copy="Gain real-time visibility into your supply chain operations. Optimize inventory, reduce costs, and improve operational efficiency.",
+        landing_page_url="https://ourcompany.com/supply-chain",
+        campaign_type="Manufacturing Newsletter",
+        target_audience="Manufacturing executives and operations managers"
+    )
+}
+
+# Company data templates for leads whose domain has no mock intelligence
+_FALLBACK_DESCRIPTION = "{company} is a {industry} company with {size}."
+_FALLBACK_WEBSITE = "Welcome to {company}. We are a leading {industry} organization focused on delivering exceptional results."
+_FALLBACK_HEADLINE = "{company} continues growth in {industry} sector"
+_FALLBACK_CHARACTERISTICS = ("Industry leader", "Growth focused", "Customer centric")
+
+# Briefing building blocks, keyed by scenario type or industry
+_ANGLES: Dict[str, str] = {
+    "saas_prospect": "Focus on workflow automation benefits and productivity gains. Emphasize scalability and integration capabilities.",
+    "enterprise_pos": "Highlight enterprise-grade features, multi-location management, and advanced analytics capabilities.",
+    "restaurant_chain": "Emphasize order accuracy, kitchen efficiency, and customer experience improvements.",
+    "healthcare_specialist": "Focus on HIPAA compliance, patient data security, and seamless billing integration.",
+    "manufacturing_optimization": "Highlight supply chain visibility, inventory optimization, and operational efficiency gains."
+}
+_DEFAULT_ANGLE = "Tailor solution to address specific business challenges and growth objectives."
+
+_STARTER_TEMPLATES: Tuple[str, ...] = (
+    "What are the biggest challenges you're currently facing in {industry} operations?",
+    "What are your priorities for the next 12 months in terms of {industry} technology?"
+)
+
+_INDUSTRY_QUESTIONS: Dict[str, str] = {
+    "Technology": "How is your team currently managing workflow automation and process optimization?",
+    "Retail": "What pain points do you experience with your current POS and inventory management systems?",
+    "Food & Beverage": "How do you currently handle order management and kitchen operations across your locations?",
+    "Healthcare": "What are your main concerns regarding patient data management and billing processes?",
+    "Manufacturing": "How do you currently track and optimize your supply chain operations?"
+}
+
+_COMMON_OBJECTIONS: Tuple[Dict[str, str], ...] = (
+    {
+        "objection": "Budget constraints - we're not ready to invest in new systems right now.",
+        "handling_strategy": "I understand budget is a concern. Our solution typically pays for itself within 6-12 months through efficiency gains. Can we explore a phased implementation approach?"
+    },
+    {
+        "objection": "We're satisfied with our current system and don't see the need to change.",
+        "handling_strategy": "I appreciate that your current system is working. However, based on what I understand about your business, there might be opportunities to achieve even better results. Would you be open to a brief demonstration?"
+    }
+)
+
+_INDUSTRY_OBJECTIONS: Dict[str, Dict[str, str]] = {
+    "Technology": {
+        "objection": "Integration complexity with our existing tech stack.",
+        "handling_strategy": "Our platform is designed with integration in mind. We have pre-built connectors for major systems and our integration team ensures smooth implementation."
+    },
+    "Retail": {
+        "objection": "Concern about system downtime during implementation across multiple locations.",
+        "handling_strategy": "We use a proven rollout methodology that minimizes disruption. We can implement location-by-location with full support during transition periods."
+    },
+    "Healthcare": {
+        "objection": "Compliance and security concerns with patient data.",
+        "handling_strategy": "Security and compliance are our top priorities. We're HIPAA compliant and can provide detailed security documentation and compliance certifications."
+    }
+}
+
+# Intern industry and scenario names so the table lookups above compare by identity
+_ANGLES = {sys.intern(k): v for k, v in _ANGLES.items()}
+_INDUSTRY_QUESTIONS = {sys.intern(k): v for k, v in _INDUSTRY_QUESTIONS.items()}
+_INDUSTRY_OBJECTIONS = {sys.intern(k): v for k, v in _INDUSTRY_OBJECTIONS.items()}
+for _lead in _LEADS:
+    object.__setattr__(_lead, "industry", sys.intern(_lead.industry))  # frozen dataclass
+    object.__setattr__(_lead, "scenario_type", sys.intern(_lead.scenario_type))
+del _lead
+
+# Briefings built so far, keyed by the (frozen, hashable) lead they describe
+_BRIEFING_CACHE: Dict[MockLead, Dict[str, Any]] = {}
+
+# Outcome of one simulated webhook test
+WebhookResult = namedtuple(
+    "WebhookResult",
+    "lead_id status processing_time company_found context_found briefing error_message",
+    defaults=(False, False, None, None)
+)
+
 class MockLeadTestSuite:
     """Comprehensive mock lead testing suite."""
     
     def __init__(self):
-        self.leads = self._generate_mock_leads()
-        self.company_data = self._generate_mock_company_data()
-        self.contexts = self._generate_mock_contexts()
+        self.leads = _LEADS
+        self.company_data = _COMPANY_DATA
+        self.contexts = _CONTEXTS
         self.results = []
+        # Leads are static, so their company and context data is looked up once
+        self._resolved = {lead.lead_id: self._resolve_lead_data(lead) for lead in self.leads}
     
-    def _generate_mock_leads(self) -> List[MockLead]:
-        """Generate diverse mock lead scenarios."""
-        return [
-            MockLead(
-                lead_id="MOCK_001_TECH_STARTUP",
-                name="Sarah Chen",
-                company="InnovateTech Solutions",
-                email="sarah.chen@innovatetech.com",
-                company_domain="innovatetech.com",
-                context_id="ctx_saas_conversion",
-                industry="Technology",
-                company_size="50-100 employees",
-                scenario_type="saas_prospect"
-            ),
-            MockLead(
-                lead_id="MOCK_002_RETAIL_ENTERPRISE",
-                name="Michael Rodriguez",
-                company="GlobalRetail Corp",
-                email="m.rodriguez@globalretail.com",
-                company_domain="globalretail.com",
-                context_id="ctx_pos_upgrade",
-                industry="Retail",
-                company_size="500+ employees",
-                scenario_type="enterprise_pos"
-            ),
-            MockLead(
-                lead_id="MOCK_003_RESTAURANT_CHAIN",
-                name="Emma Thompson",
-                company="Bella Vista Restaurants",
-                email="emma@bellavista-restaurants.com",
-                company_domain="bellavista-restaurants.com",
-                context_id="ctx_restaurant_efficiency",
-                industry="Food & Beverage",
-                company_size="20-50 employees",
-                scenario_type="restaurant_chain"
-            ),
-            MockLead(
-                lead_id="MOCK_004_HEALTHCARE_CLINIC",
-                name="Dr. James Wilson",
-                company="WellCare Medical Group",
-                email="j.wilson@wellcaremedical.com",
-                company_domain="wellcaremedical.com",
-                context_id="ctx_healthcare_compliance",
-                industry="Healthcare",
-                company_size="10-20 employees",
-                scenario_type="healthcare_specialist"
-            ),
-            MockLead(
-                lead_id="MOCK_005_MANUFACTURING",
-                name="Robert Kim",
-                company="Precision Manufacturing Inc",
-                email="r.kim@precisionmfg.com",
-                company_domain="precisionmfg.com",
-                context_id="ctx_supply_chain",
-                industry="Manufacturing",
-                company_size="200-500 employees",
-                scenario_type="manufacturing_optimization"
-            ),
-            MockLead(
-                lead_id="MOCK_006_ERROR_SCENARIO",
-                name="Test Error",
-                company="Non-Existent Company",
-                email="error@test.com",
-                company_domain="non-existent-domain-12345.com",
-                context_id="ctx_invalid",
-                industry="Testing",
-                company_size="Unknown",
-                scenario_type="error_testing"
-            )
-        ]
-    
-    def _generate_mock_company_data(self) -> Dict[str, MockCompanyData]:
-        """Generate mock company intelligence data."""
-        return {
-            "innovatetech.com": MockCompanyData(
-                domain="innovatetech.com",
-                company_name="InnovateTech Solutions",
-                industry="Technology",
-                description="A leading SaaS provider specializing in workflow automation and productivity tools",
-                website_content="InnovateTech Solutions empowers businesses with cutting-edge automation tools. Our platform integrates seamlessly with existing workflows, providing real-time analytics and intelligent process optimization. Founded in 2018, we serve over 10,000 customers worldwide.",
-                news_headlines=[
-                    "InnovateTech raises $15M Series B funding for AI expansion",
-                    "New workflow automation features launched for enterprise clients",
-                    "Partnership announced with major cloud infrastructure provider"
-                ],
-                key_characteristics=["Cloud-native", "AI-powered", "Enterprise-focused", "Rapid growth"]
-            ),
-            "globalretail.com": MockCompanyData(
-                domain="globalretail.com",
-                company_name="GlobalRetail Corp",
-                industry="Retail",
-                description="International retail chain with 500+ locations across North America and Europe",
-                website_content="GlobalRetail Corp operates premium retail stores across multiple categories including fashion, electronics, and home goods. With over 500 locations and 25 years of experience, we focus on delivering exceptional customer experiences through innovative retail technology.",
-                news_headlines=[
-                    "GlobalRetail reports 12% growth in Q3 2024 same-store sales",
-                    "New omnichannel customer experience platform launched",
-                    "Sustainability initiative reduces carbon footprint by 30%"
-                ],
-                key_characteristics=["Multi-location", "Omnichannel", "Customer-centric", "Sustainability focus"]
-            ),
-            "bellavista-restaurants.com": MockCompanyData(
-                domain="bellavista-restaurants.com",
-                company_name="Bella Vista Restaurants",
-                industry="Food & Beverage",
-                description="Family-owned restaurant chain known for authentic Italian cuisine and exceptional service",
-                website_content="Bella Vista Restaurants brings authentic Italian flavors to communities across the region. Our 8 locations feature fresh, locally-sourced ingredients and traditional recipes passed down through generations. We pride ourselves on creating memorable dining experiences for families and food enthusiasts.",
-                news_headlines=[
-                    "Bella Vista wins 'Best Italian Restaurant' award for third consecutive year",
-                    "New location opening in downtown district with enhanced dining experience",
-                    "Local sourcing program supports regional farmers and suppliers"
-                ],
-                key_characteristics=["Family-owned", "Authentic cuisine", "Local sourcing", "Community focused"]
-            ),
-            "wellcaremedical.com": MockCompanyData(
-                domain="wellcaremedical.com",
-                company_name="WellCare Medical Group",
-                industry="Healthcare",
-                description="Comprehensive medical practice providing primary care and specialized services",
-                website_content="WellCare Medical Group is a patient-centered practice offering comprehensive healthcare services including primary care, preventive medicine, and specialized treatments. Our team of experienced physicians and healthcare professionals is committed to providing personalized, high-quality care in a comfortable environment.",
-                news_headlines=[
-                    "WellCare implements new patient portal for enhanced communication",
-                    "Telemedicine services expanded to serve rural communities",
-                    "Practice achieves NCQA Patient-Centered Medical Home recognition"
-                ],
-                key_characteristics=["Patient-centered", "Technology-enabled", "Comprehensive care", "Quality focused"]
-            ),
-            "precisionmfg.com": MockCompanyData(
-                domain="precisionmfg.com",
-                company_name="Precision Manufacturing Inc",
-                industry="Manufacturing",
-                description="Advanced manufacturing company specializing in precision components for aerospace and automotive industries",
-                website_content="Precision Manufacturing Inc is a leader in high-precision component manufacturing, serving the aerospace and automotive industries for over 30 years. Our state-of-the-art facilities and ISO 9001:2015 certification ensure the highest quality standards in every product we deliver.",
-                news_headlines=[
-                    "Precision Manufacturing secures major aerospace contract worth $50M",
-                    "New automated production line increases capacity by 40%",
-                    "Company invests in Industry 4.0 technologies for smart manufacturing"
-                ],
-                key_characteristics=["Precision engineering", "Aerospace certified", "Automated production", "Quality excellence"]
-            )
-        }
-    
-    def _generate_mock_contexts(self) -> Dict[str, MockContext]:
-        """Generate mock lead context data."""
-        return {
-            "ctx_saas_conversion": MockContext(
-                context_id="ctx_saas_conversion",
-                campaign_name="SaaS Workflow Optimization Campaign",
-                source_copy="Transform your business processes with AI-powered workflow automation. Increase productivity by 40% and reduce manual tasks.",
-                landing_page_url="https://ourcompany.com/saas-automation",
-                campaign_type="Digital Ads",
-                target_audience="Tech startups and scale-ups looking to optimize operations"
-            ),
-            "ctx_pos_upgrade": MockContext(
-                context_id="ctx_pos_upgrade",
-                campaign_name="Enterprise POS Modernization",
-                source_copy="Modernize your point-of-sale systems with cloud-based solutions. Real-time inventory, advanced analytics, and seamless integrations.",
-                landing_page_url="https://ourcompany.com/enterprise-pos",
-                campaign_type="LinkedIn Sponsored Content",
-                target_audience="Retail executives and IT decision makers"
-            ),
-            "ctx_restaurant_efficiency": MockContext(
-                context_id="ctx_restaurant_efficiency",
-                campaign_name="Restaurant Operations Excellence",
-                source_copy="Streamline your restaurant operations from order to payment. Reduce wait times, improve accuracy, and enhance customer satisfaction.",
-                landing_page_url="https://ourcompany.com/restaurant-solutions",
-                campaign_type="Industry Publication",
-                target_audience="Restaurant owners and managers"
-            ),
-            "ctx_healthcare_compliance": MockContext(
-                context_id="ctx_healthcare_compliance",
-                campaign_name="Healthcare-Compliant Solutions",
-                source_copy="HIPAA-compliant systems designed for healthcare providers. Secure patient data management with seamless billing integration.",
-                landing_page_url="https://ourcompany.com/healthcare-compliance",
-                campaign_type="Healthcare Trade Show",
-                target_audience="Medical practice administrators and physicians"
-            ),
-            "ctx_supply_chain": MockContext(
-                context_id="ctx_supply_chain",
-                campaign_name="Manufacturing Supply Chain Optimization",
-                source_copy="Gain real-time visibility into your supply chain operations. Optimize inventory, reduce costs, and improve operational efficiency.",
-                landing_page_url="https://ourcompany.com/supply-chain",
-                campaign_type="Manufacturing Newsletter",
-                target_audience="Manufacturing executives and operations managers"
-            )
-        }
+    def _resolve_lead_data(self, lead: MockLead) -> Tuple[Optional[MockCompanyData], Optional[MockContext]]:
+        """Look up the company intelligence and campaign context for a lead."""
+        # Simulate company intelligence gathering
+        company_data = self.company_data.get(lead.company_domain)
+        if not company_data and lead.scenario_type != "error_testing":
+            # Generate fallback data for unknown companies
+            company_data = self._generate_fallback_company_data(lead)
+        
+        # Simulate context retrieval
+        return company_data, self.contexts.get(lead.context_id)
     
-    async def simulate_webhook_test(self, lead: MockLead) -> Dict[str, Any]:
+    def simulate_webhook_test(self, lead: MockLead) -> WebhookResult:
         """Simulate a webhook request for the given lead."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
-        logger.info(f"🧪 Testing lead: {lead.lead_id} ({lead.scenario_type})")
+        logger.info("🧪 Testing lead: %s (%s)", lead.lead_id, lead.scenario_type)
         
         try:
-            # Simulate company intelligence gathering
-            company_data = self.company_data.get(lead.company_domain)
-            if not company_data and lead.scenario_type != "error_testing":
-                # Generate fallback data for unknown companies
-                company_data = self._generate_fallback_company_data(lead)
-            
-            # Simulate context retrieval
-            context_data = self.contexts.get(lead.context_id, {})
+            resolved = self._resolved.get(lead.lead_id)
+            company_data, context_data = resolved if resolved else self._resolve_lead_data(lead)
             
             # Simulate AI briefing generation
             briefing = self._generate_mock_briefing(lead, company_data, context_data)
             
             # Calculate processing time
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             
-            result = {
-                "lead_id": lead.lead_id,
-                "status": "success" if lead.scenario_type != "error_testing" else "error_handled",
-                "processing_time": round(processing_time, 3),
-                "company_found": company_data is not None,
-                "context_found": bool(context_data),
-                "briefing": briefing if lead.scenario_type != "error_testing" else None,
-                "error_message": "Domain not accessible" if lead.scenario_type == "error_testing" else None
-            }
+            result = WebhookResult(
+                lead_id=lead.lead_id,
+                status="success" if lead.scenario_type != "error_testing" else "error_handled",
+                processing_time=round(processing_time, 3),
+                company_found=company_data is not None,
+                context_found=bool(context_data),
+                briefing=briefing if lead.scenario_type != "error_testing" else None,
+                error_message="Domain not accessible" if lead.scenario_type == "error_testing" else None
+            )
             
             if lead.scenario_type != "error_testing":
-                logger.info(f"✅ {lead.lead_id}: Generated briefing in {processing_time:.3f}s")
+                logger.info("✅ %s: Generated briefing in %.3fs", lead.lead_id, processing_time)
                 if company_data:
-                    logger.info(f"   Company: {company_data.company_name} ({company_data.industry})")
+                    logger.info("   Company: %s (%s)", company_data.company_name, company_data.industry)
                 if context_data:
-                    logger.info(f"   Context: {context_data.get('campaign_name', 'Unknown')}")
+                    logger.info("   Context: %s", context_data.campaign_name)
             
             return result
             
         except Exception as e:
-            logger.error(f"❌ Error testing {lead.lead_id}: {str(e)}")
-            return {
-                "lead_id": lead.lead_id,
-                "status": "error",
-                "processing_time": time.time() - start_time,
-                "error_message": str(e)
-            }
+            logger.error("❌ Error testing %s: %s", lead.lead_id, e)
+            return WebhookResult(
+                lead_id=lead.lead_id,
+                status="error",
+                processing_time=time.perf_counter() - start_time,
+                error_message=str(e)
+            )
     
     def _generate_fallback_company_data(self, lead: MockLead) -> MockCompanyData:
         """Generate fallback company data for unknown domains."""
+        industry_lc = lead.industry.lower()
         return MockCompanyData(
             domain=lead.company_domain,
             company_name=lead.company,
             industry=lead.industry,
-            description=f"{lead.company} is a {lead.industry.lower()} company with {lead.company_size}.",
-            website_content=f"Welcome to {lead.company}. We are a leading {lead.industry.lower()} organization focused on delivering exceptional results.",
-            news_headlines=[f"{lead.company} continues growth in {lead.industry} sector"],
-            key_characteristics=["Industry leader", "Growth focused", "Customer centric"]
+            description=_FALLBACK_DESCRIPTION.format(company=lead.company, industry=industry_lc, size=lead.company_size),
+            website_content=_FALLBACK_WEBSITE.format(company=lead.company, industry=industry_lc),
+            news_headlines=(_FALLBACK_HEADLINE.format(company=lead.company, industry=lead.industry),),
+            key_characteristics=_FALLBACK_CHARACTERISTICS
         )
     
-    def _generate_mock_briefing(self, lead: MockLead, company_data: MockCompanyData, context_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Generate a mock AI briefing based on lead and company data."""
+    def _generate_mock_briefing(self, lead: MockLead, company_data: MockCompanyData, context_data: Optional[MockContext]) -> Dict[str, Any]:
+        """Generate a mock AI briefing based on lead and company data.
+
+        Mock data is static, so each lead's briefing is built once and later
+        calls get a shallow copy.
+        """
         if lead.scenario_type == "error_testing":
             return None
         
-        return {
+        briefing = _BRIEFING_CACHE.get(lead)
+        if briefing is not None:
+            return dict(briefing)
+        
+        briefing = _BRIEFING_CACHE[lead] = {
             "company_profile": {
                 "name": company_data.company_name if company_data else lead.company,
                 "industry": lead.industry,
@@ -335,86 +424,52 @@ class MockLeadTestSuite:
             "conversation_starters": self._generate_conversation_starters(lead),
             "potential_objections": self._generate_objection_handling(lead)
         }
+        return dict(briefing)
     
-    def _generate_lead_angle(self, lead: MockLead, context_data: Dict[str, Any]) -> str:
+    def _generate_lead_angle(self, lead: MockLead, context_data: Optional[MockContext]) -> str:
         """Generate a targeted lead angle based on context and industry."""
-        angles = {
-            "saas_prospect": "Focus on workflow automation benefits and productivity gains. Emphasize scalability and integration capabilities.",
-            "enterprise_pos": "Highlight enterprise-grade features, multi-location management, and advanced analytics capabilities.",
-            "restaurant_chain": "Emphasize order accuracy, kitchen efficiency, and customer experience improvements.",
-            "healthcare_specialist": "Focus on HIPAA compliance, patient data security, and seamless billing integration.",
-            "manufacturing_optimization": "Highlight supply chain visibility, inventory optimization, and operational efficiency gains."
-        }
-        return angles.get(lead.scenario_type, "Tailor solution to address specific business challenges and growth objectives.")
+        return _ANGLES.get(lead.scenario_type, _DEFAULT_ANGLE)
     
     def _generate_conversation_starters(self, lead: MockLead) -> List[str]:
         """Generate contextual conversation starters."""
-        base_questions = [
-            f"What are the biggest challenges you're currently facing in {lead.industry.lower()} operations?",
-            f"How are you handling {', '.join(lead.expected_challenges[:2]).lower()} in your current setup?",
-            f"What are your priorities for the next 12 months in terms of {lead.industry.lower()} technology?"
-        ]
+        industry_lc = lead.industry.lower()
+        base_questions = [template.format(industry=industry_lc) for template in _STARTER_TEMPLATES]
         
-        industry_specific = {
-            "Technology": "How is your team currently managing workflow automation and process optimization?",
-            "Retail": "What pain points do you experience with your current POS and inventory management systems?",
-            "Food & Beverage": "How do you currently handle order management and kitchen operations across your locations?",
-            "Healthcare": "What are your main concerns regarding patient data management and billing processes?",
-            "Manufacturing": "How do you currently track and optimize your supply chain operations?"
-        }
-        
-        if lead.industry in industry_specific:
-            base_questions.append(industry_specific[lead.industry])
+        industry_question = _INDUSTRY_QUESTIONS.get(lead.industry)
+        if industry_question:
+            base_questions.append(industry_question)
         
         return base_questions
     
-    def _generate_objection_handling(self, lead: MockLead) -> List[Dict[str, str]]:
+    def _generate_objection_handling(self, lead: MockLead) -> Tuple[Dict[str, str], ...]:
         """Generate potential objections and handling strategies."""
-        common_objections = [
-            {
-                "objection": "Budget constraints - we're not ready to invest in new systems right now.",
-                "handling_strategy": "I understand budget is a concern. Our solution typically pays for itself within 6-12 months through efficiency gains. Can we explore a phased implementation approach?"
-            },
-            {
-                "objection": "We're satisfied with our current system and don't see the need to change.",
-                "handling_strategy": "I appreciate that your current system is working. However, based on what I understand about your business, there might be opportunities to achieve even better results. Would you be open to a brief demonstration?"
-            }
-        ]
-        
-        industry_specific = {
-            "Technology": {
-                "objection": "Integration complexity with our existing tech stack.",
-                "handling_strategy": "Our platform is designed with integration in mind. We have pre-built connectors for major systems and our integration team ensures smooth implementation."
-            },
-            "Retail": {
-                "objection": "Concern about system downtime during implementation across multiple locations.",
-                "handling_strategy": "We use a proven rollout methodology that minimizes disruption. We can implement location-by-location with full support during transition periods."
-            },
-            "Healthcare": {
-                "objection": "Compliance and security concerns with patient data.",
-                "handling_strategy": "Security and compliance are our top priorities. We're HIPAA compliant and can provide detailed security documentation and compliance certifications."
-            }
-        }
-        
-        if lead.industry in industry_specific:
-            common_objections.append(industry_specific[lead.industry])
-        
-        return common_objections
+        industry_objection = _INDUSTRY_OBJECTIONS.get(lead.industry)
+        if industry_objection:
+            return _COMMON_OBJECTIONS + (industry_objection,)
+        return _COMMON_OBJECTIONS
     
-    async def run_all_tests(self) -> Dict[str, Any]:
-        """Run all mock lead tests."""
+    def run_all_tests(self, scenarios: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Run all mock lead tests, or only those whose scenario_type is in scenarios."""
         logger.info("🚀 Starting mock lead testing...")
         
-        start_time = time.time()
-        tasks = [self.simulate_webhook_test(lead) for lead in self.leads]
-        results = await asyncio.gather(*tasks)
-        total_time = time.time() - start_time
+        leads = [lead for lead in self.leads if scenarios is None or lead.scenario_type in scenarios]
+        
+        start_time = time.perf_counter()
+        results = [self.simulate_webhook_test(lead) for lead in leads]
+        total_time = time.perf_counter() - start_time
+        
+        # Tally statuses and timings in a single pass
+        status_counts = Counter()
+        total_processing_time = 0.0
+        for r in results:
+            status_counts[r.status] += 1
+            total_processing_time += r.processing_time
         
-        successful_tests = len([r for r in results if r["status"] == "success"])
-        error_handled_tests = len([r for r in results if r["status"] == "error_handled"])
-        failed_tests = len([r for r in results if r["status"] == "error"])
+        successful_tests = status_counts["success"]
+        error_handled_tests = status_counts["error_handled"]
+        failed_tests = status_counts["error"]
         
-        avg_processing_time = sum(r["processing_time"] for r in results) / len(results)
+        avg_processing_time = total_processing_time / len(results) if results else 0.0
         
         summary = {
             "total_tests": len(results),
@@ -435,14 +490,26 @@ def main():
     """Main entry point for the mock testing script."""
     parser = argparse.ArgumentParser(description="Mock Lead Data Testing")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
+    parser.add_argument(
+        "--scenario",
+        dest="scenarios",
+        action="append",
+        choices=sorted({lead.scenario_type for lead in _LEADS}),
+        help="Only run leads with this scenario type (repeatable)"
+    )
     
     args = parser.parse_args()
     
     test_suite = MockLeadTestSuite()
-    results = asyncio.run(test_suite.run_all_tests())
+    results = test_suite.run_all_tests(args.scenarios)
     
     if args.verbose:
-        print(json.dumps(results, indent=2))
+        results["results"] = [r._asdict() for r in results["results"]]
+        if orjson:
+            sys.stdout.buffer.write(orjson.dumps(results, option=orjson.OPT_INDENT_2) + b"\n")
+        else:
+            import json
+            print(json.dumps(results, indent=2))
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -3,11 +3,16 @@ Mock Leads Database for Mei AI Agent
 Contains business context and ad interaction data for personalized chat experience
 """
 
-import csv
-from typing import Dict, List, Optional
+import functools
+import heapq
+import re
+import string
+import sys
+from array import array
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MockLead:
     lead_id: str
     company_name: str
@@ -32,6 +37,11 @@ class MockLead:
     num_outlets: int = 1
     contact_role: str = ""
     preferred_language: str = ""
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "MockLead":
+        """Build a MockLead from a MOCK_LEADS_DATA row; missing optional fields keep their defaults"""
+        return cls(**{name: data[name] for name in cls.__dataclass_fields__ if name in data})
 
 # Enhanced mock leads data from CSV
 MOCK_LEADS_DATA = [
@@ -267,6 +277,57 @@ MOCK_LEADS_DATA = [
     }
 ]
 
+# Intern the low-cardinality categorical fields so repeated values across
+# leads share one string object
+_INTERNED_LEAD_FIELDS = (
+    "context_id", "source_visual_url", "business_operation", "industry",
+    "existing_pos_system", "when_need_pos", "contact_role", "preferred_language"
+)
+for _lead in MOCK_LEADS_DATA:
+    for _field in _INTERNED_LEAD_FIELDS:
+        if _field in _lead:
+            _lead[_field] = sys.intern(_lead[_field])
+del _lead, _field
+
+# Shared stand-in for missing intel/ad context (never mutated)
+_EMPTY: Dict = {}
+
+# Urgency labels as small sortable ints; unknown urgency sorts last
+_URGENCY_RANK: Dict[str, int] = {"Immediate": 0, "High": 1, "Medium": 2, "Low": 3}
+_UNKNOWN_URGENCY_RANK = len(_URGENCY_RANK)
+
+@dataclass(slots=True)
+class LeadColumns:
+    """Column-oriented copy of MOCK_LEADS_DATA; row i of every column is the same lead"""
+    lead_ids: List[str]
+    company_names: List[str]
+    revenues: array  # average_revenue_month
+    annual_revenues: array  # revenues * 12
+    daily_orders: array  # average_orders_per_day
+    basket_sizes: array  # basket_size_order
+    num_outlets: array
+    business_intels: List[Dict]  # intel joined on company_name, resolved once
+    urgency_ranks: array  # _URGENCY_RANK of the lead's business-intel urgency
+    
+    @classmethod
+    def from_rows(cls, rows: List[Dict], intel: Dict[str, Dict]) -> "LeadColumns":
+        revenues = array("l", (row.get("average_revenue_month", 0) for row in rows))
+        business_intels = [intel.get(row["company_name"], _EMPTY) for row in rows]
+        return cls(
+            lead_ids=[row["lead_id"] for row in rows],
+            company_names=[row["company_name"] for row in rows],
+            revenues=revenues,
+            annual_revenues=array("l", (revenue * 12 for revenue in revenues)),
+            daily_orders=array("l", (row.get("average_orders_per_day", 0) for row in rows)),
+            basket_sizes=array("l", (row.get("basket_size_order", 0) for row in rows)),
+            num_outlets=array("l", (row.get("num_outlets", 1) for row in rows)),
+            business_intels=business_intels,
+            urgency_ranks=array("B", (
+                _URGENCY_RANK.get(row_intel.get("urgency"), _UNKNOWN_URGENCY_RANK)
+                for row_intel in business_intels
+            ))
+        )
+
 # Enhanced business intelligence mapping
 BUSINESS_INTELLIGENCE = {
     "Kopi Kulture Sdn Bhd": {
@@ -401,197 +462,244 @@ BUSINESS_INTELLIGENCE = {
     }
 }
 
-# Ad context definitions (enhanced)
+# Intel phrase lists are never modified; freeze them into tuples of interned
+# strings so slices and fallbacks can hand them out without copying
+for _intel in BUSINESS_INTELLIGENCE.values():
+    for _field in ("pain_points", "quick_replies"):
+        _intel[_field] = tuple(map(sys.intern, _intel[_field]))
+del _intel, _field
+
+# Ad context definitions (enhanced). Every lead context shares these dicts by
+# reference, so their list-like values are tuples.
 AD_CONTEXTS = {
     "ad_001_pos": {
         "title": "Modern Cloud POS System",
         "focus": "Point of Sale efficiency", 
-        "pain_points": ["slow checkout", "manual cash register", "payment processing"],
+        "pain_points": ("slow checkout", "manual cash register", "payment processing"),
         "solution_angle": "streamlined POS operations",
-        "target_businesses": ["cafes", "restaurants", "QSR"]
+        "target_businesses": ("cafes", "restaurants", "QSR")
     },
     "ad_002_ecommerce": {
         "title": "Complete E-commerce Solution",
         "focus": "Online store setup",
-        "pain_points": ["no online presence", "limited reach", "inventory management"], 
+        "pain_points": ("no online presence", "limited reach", "inventory management"), 
         "solution_angle": "omnichannel retail experience",
-        "target_businesses": ["fashion", "books", "grocery", "home decor"]
+        "target_businesses": ("fashion", "books", "grocery", "home decor")
     },
     "ad_003_loyalty": {
         "title": "Digital Loyalty Program", 
         "focus": "Customer retention",
-        "pain_points": ["customer retention", "repeat business", "loyalty tracking"],
+        "pain_points": ("customer retention", "repeat business", "loyalty tracking"),
         "solution_angle": "customer lifetime value optimization",
-        "target_businesses": ["bakery", "beverage", "wellness"]
+        "target_businesses": ("bakery", "beverage", "wellness")
     }
 }
 
-def get_lead_context(lead_id: str) -> Optional[Dict]:
-    """Get comprehensive context for a lead including business intelligence and ad context"""
-    
-    # Find the lead data
-    lead_data = None
-    for lead in MOCK_LEADS_DATA:
-        if lead["lead_id"] == lead_id:
-            lead_data = lead
-            break
+LEAD_COLUMNS = LeadColumns.from_rows(MOCK_LEADS_DATA, BUSINESS_INTELLIGENCE)
+_ROW_BY_ID: Dict[str, int] = {lead_id: row for row, lead_id in enumerate(LEAD_COLUMNS.lead_ids)}
+
+# Row-oriented view of the same data: attribute reads instead of dict.get
+LEAD_ROWS: Tuple[MockLead, ...] = tuple(MockLead.from_dict(lead) for lead in MOCK_LEADS_DATA)
+
+def _build_lead_context(lead_data: Dict) -> Dict:
+    """Assemble the comprehensive context for one lead row"""
     
-    if not lead_data:
-        return None
+    row = _ROW_BY_ID[lead_data["lead_id"]]
+    lead = LEAD_ROWS[row]
+    revenue = LEAD_COLUMNS.revenues[row]
     
     # Get business intelligence
-    company_name = lead_data["company_name"] 
-    business_intel = BUSINESS_INTELLIGENCE.get(company_name, {})
+    company_name = lead.company_name
+    business_intel = LEAD_COLUMNS.business_intels[row]
     
     # Get ad context
-    context_id = lead_data["context_id"]
-    ad_context = AD_CONTEXTS.get(context_id, {})
+    ad_context = AD_CONTEXTS.get(lead.context_id, _EMPTY)
+    
+    daily_orders = LEAD_COLUMNS.daily_orders[row]
+    ad_title = ad_context.get("title", "unknown")
     
     # Enhanced context with CSV data
     enhanced_context = {
         "lead_data": lead_data,
         "business_intel": business_intel, 
         "ad_context": ad_context,
-        "personalized_context": f"This lead {lead_data.get('lead_name', 'from')} from {company_name} ({lead_data.get('sub_industry', 'business')}) clicked on our '{ad_context.get('title', 'unknown')}' ad. They generate RM{lead_data.get('average_revenue_month', 0):,}/month with {lead_data.get('average_orders_per_day', 0)} daily orders. Current system: {lead_data.get('existing_pos_system', 'Unknown')}. Timeline: {lead_data.get('when_need_pos', 'Not specified')}.",
+        "personalized_context": f"This lead {lead.lead_name} from {company_name} ({lead.sub_industry}) clicked on our '{ad_title}' ad. They generate RM{revenue:,}/month with {daily_orders} daily orders. Current system: {lead.existing_pos_system}. Timeline: {lead.when_need_pos}.",
         "financial_profile": {
-            "monthly_revenue": lead_data.get("average_revenue_month", 0),
-            "daily_orders": lead_data.get("average_orders_per_day", 0),
-            "basket_size": lead_data.get("basket_size_order", 0),
-            "annual_revenue_estimate": lead_data.get("average_revenue_month", 0) * 12
+            "monthly_revenue": revenue,
+            "daily_orders": daily_orders,
+            "basket_size": LEAD_COLUMNS.basket_sizes[row],
+            "annual_revenue_estimate": LEAD_COLUMNS.annual_revenues[row]
         },
         "contact_info": {
-            "name": lead_data.get("lead_name", ""),
-            "role": lead_data.get("contact_role", ""),
-            "email": lead_data.get("email", ""),
-            "phone": lead_data.get("phone", ""),
-            "preferred_language": lead_data.get("preferred_language", "English")
+            "name": lead.lead_name,
+            "role": lead.contact_role,
+            "email": lead.email,
+            "phone": lead.phone,
+            "preferred_language": lead.preferred_language
         },
         "operational_details": {
-            "num_outlets": lead_data.get("num_outlets", 1),
-            "current_platform": lead_data.get("merchant_current_platform", "None"),
-            "existing_pos": lead_data.get("existing_pos_system", "None"),
-            "urgency": lead_data.get("when_need_pos", "Not specified")
+            "num_outlets": LEAD_COLUMNS.num_outlets[row],
+            "current_platform": lead.merchant_current_platform,
+            "existing_pos": lead.existing_pos_system,
+            "urgency": lead.when_need_pos
         }
     }
     
     return enhanced_context
 
-def get_contextual_quick_replies(lead_id: str, mei_last_message: str = "") -> List[str]:
-    """Generate contextual quick replies based on lead's business context and Mei's last question (FALLBACK)"""
+# The mock data is static, so every lead's context is built once at import.
+# Callers share these dicts and must treat them as read-only.
+_CONTEXT_BY_ID: Dict[str, Dict] = {lead["lead_id"]: _build_lead_context(lead) for lead in MOCK_LEADS_DATA}
+
+def get_lead_context(lead_id: str) -> Optional[Dict]:
+    """Get comprehensive context for a lead including business intelligence and ad context"""
+    return _CONTEXT_BY_ID.get(lead_id)
+
+def _kw(*keywords: str) -> frozenset:
+    """Interned keyword set for one quick-reply category"""
+    return frozenset(map(sys.intern, keywords))
+
+# Quick-reply categories for Mei's questions, in priority order: the first
+# category with a keyword in the message wins. Keywords match as word
+# prefixes, so "demonstration" cues demo and "affordable" cues budget.
+_QUESTION_CATEGORIES = (
+    ("business_type", _kw("business", "industry", "type", "running"), (
+        "We run a restaurant",
+        "It's a retail store",
+        "Coffee shop business"
+    )),
+    ("location", _kw("location", "where", "based", "operating"), (
+        "Kuala Lumpur area",
+        "Selangor, Malaysia",
+        "Petaling Jaya"
+    )),
+    ("role", _kw("owner", "manager", "decision", "charge", "responsible"), (
+        "Yes, I'm the owner",
+        "I'm the manager",
+        "I make decisions"
+    )),
+    ("current_system", _kw("current", "system", "problem", "challenge", "difficulty", "pos", "setup"), (
+        "Manual cash register",
+        "No inventory system",
+        "Payment is slow"
+    )),
+    ("goals", _kw("achieve", "looking", "hoping", "goal", "improve", "want"), (
+        "Speed up service",
+        "Better tracking",
+        "Grow sales"
+    )),
+    ("team_size", _kw("staff", "employee", "team", "people", "work"), (
+        "3-4 staff members",
+        "Just me and partner",
+        "5 employees total"
+    )),
+    ("sales_volume", _kw("sales", "customer", "daily", "volume", "busy"), (
+        "100+ customers daily",
+        "RM1000-2000 sales",
+        "Very busy lunch"
+    )),
+    ("timeline", _kw("when", "timeline", "urgent", "soon", "planning"), (
+        "As soon as possible",
+        "Within next month",
+        "This quarter"
+    )),
+    ("budget", _kw("budget", "cost", "price", "afford", "expensive"), (
+        "What's monthly cost?",
+        "Budget under RM500",
+        "Need affordable option"
+    )),
+    ("demo", _kw("demo", "meeting", "show", "presentation"), (
+        "Yes, show demo",
+        "Can we meet?",
+        "Online demo preferred"
+    )),
+    ("features", _kw("feature", "function", "integrate", "support"), (
+        "Need inventory tracking",
+        "Want online ordering",
+        "Kitchen display important"
+    )),
+)
+
+# Multi-word cues that can't be matched as single tokens; each ranks with its category
+_QUESTION_PHRASES = (("what do you", "business_type"), ("see how", "demo"))
+
+_CATEGORY_REPLIES: Dict[str, tuple] = {category: replies for category, _, replies in _QUESTION_CATEGORIES}
+_CATEGORY_PRIORITY: Dict[str, int] = {category: rank for rank, (category, _, _) in enumerate(_QUESTION_CATEGORIES)}
+
+def _compile_question_router() -> "re.Pattern[str]":
+    """One alternation with a named group per category: keywords as word prefixes, phrases anywhere"""
+    branches = []
+    for category, keywords, _ in _QUESTION_CATEGORIES:
+        words = "|".join(sorted(keywords, key=len, reverse=True))
+        phrases = "".join(f"|{re.escape(phrase)}" for phrase, cue in _QUESTION_PHRASES if cue == category)
+        branches.append(f"(?P<{category}>(?<![a-z])(?:{words})[a-z]*{phrases})")
+    return re.compile("|".join(branches))
+
+_QUESTION_ROUTER = _compile_question_router()
+
+# Lowercase and blank out ASCII punctuation in one translate pass
+_NORMALIZE_MESSAGE = str.maketrans(
+    string.ascii_uppercase + string.punctuation,
+    string.ascii_lowercase + " " * len(string.punctuation)
+)
+
+def _match_question_category(mei_lower: str) -> Optional[str]:
+    """Return the highest-priority quick-reply category cued by a normalised message"""
+    best = None
+    best_rank = len(_QUESTION_CATEGORIES)
+    for match in _QUESTION_ROUTER.finditer(mei_lower):
+        rank = _CATEGORY_PRIORITY[match.lastgroup]
+        if rank < best_rank:
+            best, best_rank = match.lastgroup, rank
+            if rank == 0:
+                break
+    return best
+
+@functools.lru_cache(maxsize=256)
+def _question_category(mei_last_message: str) -> Optional[str]:
+    """Normalise and route Mei's message; cached per message since the category doesn't depend on the lead"""
+    return _match_question_category(mei_last_message.translate(_NORMALIZE_MESSAGE))
+
+_UNKNOWN_LEAD_REPLIES = (
+    "Tell me more",
+    "I'm interested", 
+    "Show me options"
+)
+
+_DEFAULT_REPLIES = (
+    "I need help",
+    "Tell me more",
+    "Show me demo"
+)
+
+# Top 3 business-specific quick replies per lead, or the defaults if it has none
+_LEAD_FALLBACK_REPLIES: Dict[str, Tuple[str, ...]] = {
+    lead_id: intel.get("quick_replies", ())[:3] or _DEFAULT_REPLIES
+    for lead_id, intel in zip(LEAD_COLUMNS.lead_ids, LEAD_COLUMNS.business_intels)
+}
+
+@functools.lru_cache(maxsize=512)
+def get_contextual_quick_replies(lead_id: str, mei_last_message: str = "") -> Tuple[str, ...]:
+    """Generate contextual quick replies based on lead's business context and Mei's last question (FALLBACK)
+
+    Replies are shared constants, so the returned tuple must not be copied into
+    anything that gets mutated in place.
+    """
     
     # This is now primarily a fallback function when LLM generation fails
     # If Mei's last message contains specific questions, generate relevant responses
     if mei_last_message:
-        mei_lower = mei_last_message.lower()
-        
-        # Question about business type/industry
-        if any(word in mei_lower for word in ["business", "industry", "type", "running", "what do you"]):
-            return [
-                "We run a restaurant",
-                "It's a retail store", 
-                "Coffee shop business"
-            ]
-        
-        # Questions about location
-        elif any(word in mei_lower for word in ["location", "where", "based", "operating"]):
-            return [
-                "Kuala Lumpur area",
-                "Selangor, Malaysia",
-                "Petaling Jaya"
-            ]
-        
-        # Questions about role/decision making
-        elif any(word in mei_lower for word in ["owner", "manager", "decision", "charge", "responsible"]):
-            return [
-                "Yes, I'm the owner",
-                "I'm the manager",
-                "I make decisions"
-            ]
-        
-        # Questions about current systems/problems
-        elif any(word in mei_lower for word in ["current", "system", "problem", "challenge", "difficulty", "pos", "setup"]):
-            return [
-                "Manual cash register",
-                "No inventory system", 
-                "Payment is slow"
-            ]
-        
-        # Questions about goals/achievements
-        elif any(word in mei_lower for word in ["achieve", "looking", "hoping", "goal", "improve", "want"]):
-            return [
-                "Speed up service",
-                "Better tracking",
-                "Grow sales"
-            ]
-        
-        # Questions about staff/team size
-        elif any(word in mei_lower for word in ["staff", "employee", "team", "people", "work"]):
-            return [
-                "3-4 staff members",
-                "Just me and partner",
-                "5 employees total"
-            ]
-        
-        # Questions about sales volume/customers
-        elif any(word in mei_lower for word in ["sales", "customer", "daily", "volume", "busy"]):
-            return [
-                "100+ customers daily",
-                "RM1000-2000 sales",
-                "Very busy lunch"
-            ]
-        
-        # Questions about timeline/urgency
-        elif any(word in mei_lower for word in ["when", "timeline", "urgent", "soon", "planning"]):
-            return [
-                "As soon as possible",
-                "Within next month",
-                "This quarter"
-            ]
-        
-        # Questions about budget/pricing
-        elif any(word in mei_lower for word in ["budget", "cost", "price", "afford", "expensive"]):
-            return [
-                "What's monthly cost?",
-                "Budget under RM500",
-                "Need affordable option"
-            ]
-        
-        # Questions about demo/meeting interest
-        elif any(word in mei_lower for word in ["demo", "meeting", "show", "presentation", "see how"]):
-            return [
-                "Yes, show demo",
-                "Can we meet?",
-                "Online demo preferred"
-            ]
-        
-        # Questions about specific features
-        elif any(word in mei_lower for word in ["feature", "function", "integrate", "support"]):
-            return [
-                "Need inventory tracking",
-                "Want online ordering",
-                "Kitchen display important"
-            ]
+        category = _question_category(mei_last_message)
+        if category:
+            return _CATEGORY_REPLIES[category]
     
     # Fallback: Use business-specific context if available
-    context = get_lead_context(lead_id)
-    if not context:
-        return [
-            "Tell me more",
-            "I'm interested", 
-            "Show me options"
-        ]
-    
-    # Use top 3 business-specific quick replies as fallback
-    business_replies = context["business_intel"].get("quick_replies", [])
-    if business_replies:
-        return business_replies[:3]
-    
-    # Final default responses
-    return [
-        "I need help",
-        "Tell me more",
-        "Show me demo"
-    ]
+    return _LEAD_FALLBACK_REPLIES.get(lead_id, _UNKNOWN_LEAD_REPLIES)
+
+def get_most_urgent_leads(limit: int = 3) -> List[Dict]:
+    """Get the leads with the highest business-intel urgency (Immediate first, ties in lead order)"""
+    rows = heapq.nsmallest(limit, range(len(LEAD_COLUMNS.lead_ids)), key=LEAD_COLUMNS.urgency_ranks.__getitem__)
+    return [MOCK_LEADS_DATA[row] for row in rows]
 
 def get_all_leads() -> List[Dict]:
     """Get all mock leads for selection interface"""
@@ -10,14 +10,16 @@ AI briefings transform sales effectiveness.
 """
 
 import asyncio
-import json
+import functools
 import time
-import requests
+import httpx
+import orjson
 from datetime import datetime
-from typing import Dict, List, Any
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Any
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MockScenario:
     """Mock sales scenario for testing."""
     lead_id: str
@@ -31,84 +33,239 @@ class MockScenario:
     lead_source: str
     scenario_description: str
 
+# Diverse mock sales scenarios similar to Bella Vista Café (static fixtures)
+_MOCK_SCENARIOS: Tuple[MockScenario, ...] = (
+    MockScenario(
+        lead_id="MOCK_RESTAURANT_001",
+        company_name="Bella Vista Restaurants",
+        contact_name="Sarah Martinez", 
+        contact_role="Operations Manager",
+        company_domain="bellavista-restaurants.com",
+        context_id="pos_restaurant_form",
+        industry="Food & Beverage",
+        company_size="8 locations",
+        lead_source="POS system ad form fill",
+        scenario_description="Multi-location restaurant chain interested in POS upgrade"
+    ),
+    MockScenario(
+        lead_id="MOCK_RETAIL_002", 
+        company_name="Urban Fashion Boutique",
+        contact_name="Jessica Chen",
+        contact_role="Store Manager",
+        company_domain="urbanfashionboutique.com",
+        context_id="retail_efficiency_webinar",
+        industry="Retail",
+        company_size="3 stores",
+        lead_source="Retail efficiency webinar",
+        scenario_description="Fashion boutique looking to modernize checkout experience"
+    ),
+    MockScenario(
+        lead_id="MOCK_HEALTHCARE_003",
+        company_name="WellCare Medical Group", 
+        contact_name="Dr. James Wilson",
+        contact_role="Practice Administrator",
+        company_domain="wellcaremedical.com",
+        context_id="healthcare_compliance_guide",
+        industry="Healthcare",
+        company_size="12 providers",
+        lead_source="Healthcare compliance guide download",
+        scenario_description="Medical practice needing HIPAA-compliant billing solution"
+    ),
+    MockScenario(
+        lead_id="MOCK_TECH_STARTUP_004",
+        company_name="InnovateTech Solutions",
+        contact_name="Alex Rodriguez",
+        contact_role="CTO", 
+        company_domain="innovatetech.com",
+        context_id="saas_scaling_article",
+        industry="Technology",
+        company_size="85 employees",
+        lead_source="SaaS scaling article engagement",
+        scenario_description="Growing tech startup needing workflow automation"
+    ),
+    MockScenario(
+        lead_id="MOCK_MANUFACTURING_005",
+        company_name="Precision Components Inc",
+        contact_name="Robert Kim",
+        contact_role="Operations Director",
+        company_domain="precisioncomponents.com", 
+        context_id="supply_chain_optimization",
+        industry="Manufacturing",
+        company_size="250 employees",
+        lead_source="Supply chain optimization whitepaper",
+        scenario_description="Manufacturer seeking inventory management improvement"
+    )
+)
+
+# Static console banners and rules, laid out once at import
+_APPROACH_RULE = "=" * 60
+_SUMMARY_RULE = "-" * 50
+_RUN_BANNER = "\n".join((
+    "🚀 STARTING COMPREHENSIVE SALES APPROACH COMPARISON",
+    "=" * 80,
+    "Testing AI-Powered Sales Briefings vs Traditional Cold Calling",
+    "Based on the 'Bella Vista Café' cold calling example",
+    "=" * 80
+))
+_FINAL_RESULTS_RULE = f"\n{'🏆 FINAL COMPARISON RESULTS':=^80}"
+_BUSINESS_IMPACT_RULE = f"\n{'💥 BUSINESS IMPACT':=^80}"
+_TRANSFORMATION_RULE = f"\n{'🔥 THE TRANSFORMATION':=^80}"
+_CONCLUSION = "\n".join((
+    f"\n{'=' * 80}",
+    "🎯 CONCLUSION: AI briefings transform generic cold calls into personalized,",
+    "   professional sales conversations that build relationships and close deals.",
+    "=" * 80
+))
+
+def _elapsed_ms(start_ns: int) -> int:
+    """Whole milliseconds since a time.perf_counter_ns() reading (monotonic)."""
+    return (time.perf_counter_ns() - start_ns) // 1_000_000
+
+# Short connect timeout so a stopped server fails fast
+_HEALTH_CHECK_TIMEOUT = httpx.Timeout(5.0, connect=0.5)
+
+def _webhook_payload(scenario: MockScenario) -> Dict[str, str]:
+    """Request body for the /webhook endpoint (scenarios are frozen, so it can be built once)."""
+    return {
+        "company_domain": scenario.company_domain,
+        "context_id": scenario.context_id,
+        "lead_id": scenario.lead_id
+    }
+
+# Close probabilities behind the improvement metrics
+_COLD_CLOSE_PROB = 15  # From cold calling example
+_AI_CLOSE_PROB = 65    # Based on AI briefing quality
+
+_CLOSE_PROBABILITY_IMPROVEMENT = f"{_AI_CLOSE_PROB - _COLD_CLOSE_PROB}% increase"
+_STATIC_IMPROVEMENTS: Dict[str, Any] = {
+    "roi_on_preparation": f"{(_AI_CLOSE_PROB / _COLD_CLOSE_PROB - 1) * 100:.0f}% improvement",
+    "professionalism_boost": "High - Shows research and preparation",
+    "relationship_building": "Excellent - Personalized approach builds trust",
+    "competitive_differentiation": "Strong - Stands out from generic competitors",
+    "key_advantages": (
+        "Company-specific insights vs generic pitch",
+        "Targeted conversation starters vs feature dumping", 
+        "Proactive objection handling vs reactive responses",
+        "Professional preparation vs winging it"
+    )
+}
+
+# Sections a complete briefing must contain
+_REQUIRED_BRIEFING_KEYS = frozenset({
+    "company_profile", "key_updates", "lead_angle", "conversation_starters", "potential_objections"
+})
+
+class BriefingView(NamedTuple):
+    """The briefing sections the scorer and summary read, each fetched once."""
+    profile: Any
+    updates: Sequence[Any]
+    starters: Sequence[Any]
+    objections: Sequence[Any]
+    angle: Any
+
+# Shared defaults for missing sections, so lookups don't allocate
+_EMPTY_SECTION: Tuple = ()
+_EMPTY_TEXT = ""
+_EMPTY_RESULT: Dict[str, Any] = {}  # never mutated
+
+def _view(briefing: Dict[str, Any]) -> BriefingView:
+    """Fetch each section of a briefing once, with shared immutable defaults."""
+    return BriefingView(
+        profile=briefing.get("company_profile", _EMPTY_TEXT),
+        updates=briefing.get("key_updates", _EMPTY_SECTION),
+        starters=briefing.get("conversation_starters", _EMPTY_SECTION),
+        objections=briefing.get("potential_objections", _EMPTY_SECTION),
+        angle=briefing.get("lead_angle", _EMPTY_TEXT)
+    )
+
+def _profile_features(profile: Any) -> Tuple[int, bool]:
+    """Length of the rendered company profile and whether it mentions specifics/industry.
+    
+    The profile (often a dict) is rendered and lowercased once for both checks.
+    """
+    company_profile = str(profile)
+    profile_lower = company_profile.lower()
+    return len(company_profile), "specific" in profile_lower or "industry" in profile_lower
+
+@functools.lru_cache(maxsize=256)
+def _personalization_score(mentions_specifics: bool, lead_angle_length: int, starters_count: int, objections_count: int) -> int:
+    """Score a briefing from the few features the personalization rules look at."""
+    score = 0
+    
+    # Check for specific company mentions
+    if mentions_specifics:
+        score += 20
+        
+    # Check for targeted lead angle
+    if lead_angle_length > 50:
+        score += 25
+        
+    # Check for meaningful conversation starters
+    if starters_count >= 3:
+        score += 25
+        
+    # Check for specific objection handling
+    if objections_count >= 2:
+        score += 30
+        
+    return min(score, 100)
+
 class MockSalesScenarioTester:
     """Test suite demonstrating AI briefing value vs cold calling."""
     
-    def __init__(self, base_url: str = "http://localhost:8000"):
+    def __init__(self, base_url: str = "http://localhost:8000", max_workers: int = 10, keep_raw: bool = False):
         self.base_url = base_url
-        self.scenarios = self._create_mock_scenarios()
-        
-    def _create_mock_scenarios(self) -> List[MockScenario]:
-        """Create diverse mock sales scenarios similar to Bella Vista Café."""
-        return [
-            MockScenario(
-                lead_id="MOCK_RESTAURANT_001",
-                company_name="Bella Vista Restaurants",
-                contact_name="Sarah Martinez", 
-                contact_role="Operations Manager",
-                company_domain="bellavista-restaurants.com",
-                context_id="pos_restaurant_form",
-                industry="Food & Beverage",
-                company_size="8 locations",
-                lead_source="POS system ad form fill",
-                scenario_description="Multi-location restaurant chain interested in POS upgrade"
-            ),
-            MockScenario(
-                lead_id="MOCK_RETAIL_002", 
-                company_name="Urban Fashion Boutique",
-                contact_name="Jessica Chen",
-                contact_role="Store Manager",
-                company_domain="urbanfashionboutique.com",
-                context_id="retail_efficiency_webinar",
-                industry="Retail",
-                company_size="3 stores",
-                lead_source="Retail efficiency webinar",
-                scenario_description="Fashion boutique looking to modernize checkout experience"
-            ),
-            MockScenario(
-                lead_id="MOCK_HEALTHCARE_003",
-                company_name="WellCare Medical Group", 
-                contact_name="Dr. James Wilson",
-                contact_role="Practice Administrator",
-                company_domain="wellcaremedical.com",
-                context_id="healthcare_compliance_guide",
-                industry="Healthcare",
-                company_size="12 providers",
-                lead_source="Healthcare compliance guide download",
-                scenario_description="Medical practice needing HIPAA-compliant billing solution"
-            ),
-            MockScenario(
-                lead_id="MOCK_TECH_STARTUP_004",
-                company_name="InnovateTech Solutions",
-                contact_name="Alex Rodriguez",
-                contact_role="CTO", 
-                company_domain="innovatetech.com",
-                context_id="saas_scaling_article",
-                industry="Technology",
-                company_size="85 employees",
-                lead_source="SaaS scaling article engagement",
-                scenario_description="Growing tech startup needing workflow automation"
-            ),
-            MockScenario(
-                lead_id="MOCK_MANUFACTURING_005",
-                company_name="Precision Components Inc",
-                contact_name="Robert Kim",
-                contact_role="Operations Director",
-                company_domain="precisioncomponents.com", 
-                context_id="supply_chain_optimization",
-                industry="Manufacturing",
-                company_size="250 employees",
-                lead_source="Supply chain optimization whitepaper",
-                scenario_description="Manufacturer seeking inventory management improvement"
-            )
-        ]
+        # Whether results keep the full briefing payload (it dominates their size)
+        self.keep_raw = keep_raw
+        self.scenarios = _MOCK_SCENARIOS
+        self._payloads = {scenario.lead_id: _webhook_payload(scenario) for scenario in self.scenarios}
+        
+        # One pooled async client for every call; over https, HTTP/2 lets the
+        # concurrent webhook calls share a single connection
+        limits = httpx.Limits(max_connections=max_workers, max_keepalive_connections=max_workers)
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=30.0,
+            transport=httpx.AsyncHTTPTransport(http2=True, limits=limits, retries=3)
+        )
+        
+        # Webhook calls started ahead of their comparison, keyed by lead_id;
+        # at most max_workers are in flight, which is what keeps the API from
+        # being overwhelmed
+        self._webhook_requests: Dict[str, asyncio.Task] = {}
+        self._max_workers = max_workers
+        self._webhook_slots = asyncio.Semaphore(max_workers)
     
+    async def warmup(self):
+        """Open the pooled connections the concurrent webhook calls will use.
+        
+        One cheap GET per connection the scenarios can use at once, so the
+        first round of briefings doesn't pay for connection setup. Best effort:
+        failures are left for the real calls to report.
+        """
+        async def _touch():
+            try:
+                await self._client.get("/", timeout=_HEALTH_CHECK_TIMEOUT)
+            except httpx.HTTPError:
+                pass
+        
+        await asyncio.gather(*(_touch() for _ in range(min(len(self.scenarios), self._max_workers))))
+    
+    async def aclose(self):
+        """Release the pooled HTTP connections."""
+        await self._client.aclose()
+    
+    async def __aenter__(self) -> "MockSalesScenarioTester":
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+        
     async def test_cold_calling_approach(self, scenario: MockScenario) -> Dict[str, Any]:
         """Simulate the 'cold calling' approach like the Bella Vista example."""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
-        print(f"\n🥶 COLD CALLING APPROACH: {scenario.company_name}")
-        print("="*60)
+        print(f"\n🥶 COLD CALLING APPROACH: {scenario.company_name}\n{_APPROACH_RULE}")
         
         # Simulate generic, uninformed sales approach
         cold_call_result = {
@@ -148,36 +305,27 @@ class MockSalesScenarioTester:
             ]
         }
         
-        processing_time = time.time() - start_time
-        cold_call_result["processing_time"] = round(processing_time, 3)
+        cold_call_result["processing_time"] = _elapsed_ms(start_ns) / 1000
         
         return cold_call_result
     
     async def test_ai_briefing_approach(self, scenario: MockScenario) -> Dict[str, Any]:
         """Test the AI-powered briefing approach using real webhook."""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
-        print(f"\n🚀 AI-POWERED APPROACH: {scenario.company_name}")
-        print("="*60)
+        print(
+            f"\n🚀 AI-POWERED APPROACH: {scenario.company_name}\n{_APPROACH_RULE}\n"
+            f"📡 Generating AI briefing for {scenario.company_name}..."
+        )
         
         try:
-            # Make actual API call to our webhook endpoint
-            webhook_data = {
-                "company_domain": scenario.company_domain,
-                "context_id": scenario.context_id,
-                "lead_id": scenario.lead_id
-            }
-            
-            print(f"📡 Generating AI briefing for {scenario.company_name}...")
-            
-            response = requests.post(
-                f"{self.base_url}/webhook",
-                json=webhook_data,
-                timeout=30
-            )
+            # Join the call run_all_scenarios already started, or make it now
+            request = self._webhook_requests.pop(scenario.lead_id, None)
+            response = await (request if request is not None else self._post_webhook(scenario))
             
             if response.status_code == 200:
-                briefing_data = response.json()
+                briefing_data = orjson.loads(response.content)
+                view = _view(briefing_data["briefing"])
                 
                 # Analyze the AI briefing quality
                 ai_result = {
@@ -187,7 +335,7 @@ class MockSalesScenarioTester:
                     "contact_name": scenario.contact_name,
                     "preparation_time": briefing_data["metadata"]["processing_time_seconds"],
                     "briefing_generated": True,
-                    "briefing_quality": self._analyze_briefing_quality(briefing_data["briefing"]),
+                    "briefing_quality": self._analyze_briefing_quality(briefing_data["briefing"], view),
                     "personalization_level": "High - Company-specific insights",
                     "company_intelligence": {
                         "profile_depth": "Comprehensive company analysis",
@@ -215,12 +363,12 @@ class MockSalesScenarioTester:
                         "Personalized value proposition",
                         "Proactive objection handling",
                         "Context-aware conversation flow"
-                    ],
-                    "raw_briefing": briefing_data["briefing"]
+                    ]
                 }
+                if self.keep_raw:
+                    ai_result["raw_briefing"] = briefing_data["briefing"]
                 
-                print(f"✅ AI briefing generated successfully!")
-                self._print_briefing_summary(briefing_data["briefing"], scenario)
+                self._print_briefing_summary(view, scenario)
                 
             else:
                 # Handle API errors gracefully
@@ -242,85 +390,88 @@ class MockSalesScenarioTester:
             }
             print(f"❌ Error: {str(e)}")
         
-        processing_time = time.time() - start_time
-        ai_result["total_processing_time"] = round(processing_time, 3)
+        ai_result["total_processing_time"] = _elapsed_ms(start_ns) / 1000
         
         return ai_result
     
-    def _analyze_briefing_quality(self, briefing: Dict[str, Any]) -> Dict[str, Any]:
+    async def _post_webhook(self, scenario: MockScenario) -> httpx.Response:
+        """Make the actual API call to our webhook endpoint."""
+        webhook_data = self._payloads.get(scenario.lead_id) or _webhook_payload(scenario)
+        async with self._webhook_slots:
+            return await self._client.post("/webhook", json=webhook_data)
+    
+    def _analyze_briefing_quality(self, briefing: Dict[str, Any], view: Optional[BriefingView] = None) -> Dict[str, Any]:
         """Analyze the quality and completeness of the AI briefing."""
+        if view is None:
+            view = _view(briefing)
+        profile_length, mentions_specifics = _profile_features(view.profile)
         return {
-            "company_profile_depth": "comprehensive" if len(str(briefing.get("company_profile", ""))) > 100 else "basic",
-            "key_updates_count": len(briefing.get("key_updates", [])),
-            "conversation_starters_count": len(briefing.get("conversation_starters", [])),
-            "objection_handling_count": len(briefing.get("potential_objections", [])),
-            "personalization_score": self._calculate_personalization_score(briefing),
-            "completeness": "high" if all(k in briefing for k in ["company_profile", "key_updates", "lead_angle", "conversation_starters", "potential_objections"]) else "partial"
+            "company_profile_depth": "comprehensive" if profile_length > 100 else "basic",
+            "key_updates_count": len(view.updates),
+            "conversation_starters_count": len(view.starters),
+            "objection_handling_count": len(view.objections),
+            "personalization_score": self._calculate_personalization_score(view, mentions_specifics),
+            "completeness": "high" if _REQUIRED_BRIEFING_KEYS <= briefing.keys() else "partial"
         }
     
-    def _calculate_personalization_score(self, briefing: Dict[str, Any]) -> int:
-        """Calculate personalization score based on briefing content."""
-        score = 0
-        
-        # Check for specific company mentions
-        company_profile = str(briefing.get("company_profile", "")).lower()
-        if "specific" in company_profile or "industry" in company_profile:
-            score += 20
-            
-        # Check for targeted lead angle
-        lead_angle = str(briefing.get("lead_angle", ""))
-        if len(lead_angle) > 50:
-            score += 25
-            
-        # Check for meaningful conversation starters
-        starters = briefing.get("conversation_starters", [])
-        if len(starters) >= 3:
-            score += 25
-            
-        # Check for specific objection handling
-        objections = briefing.get("potential_objections", [])
-        if len(objections) >= 2:
-            score += 30
-            
-        return min(score, 100)
+    def _calculate_personalization_score(self, view: BriefingView, mentions_specifics: Optional[bool] = None) -> int:
+        """Calculate personalization score based on briefing content.
+        
+        ``mentions_specifics`` can be passed when the caller already ran
+        _profile_features on this briefing.
+        """
+        if mentions_specifics is None:
+            mentions_specifics = _profile_features(view.profile)[1]
+        return _personalization_score(
+            mentions_specifics,
+            len(str(view.angle)),
+            len(view.starters),
+            len(view.objections)
+        )
     
-    def _print_briefing_summary(self, briefing: Dict[str, Any], scenario: MockScenario):
-        """Print a formatted summary of the AI briefing."""
-        print(f"\n📋 AI BRIEFING SUMMARY for {scenario.contact_name} at {scenario.company_name}")
-        print("-" * 50)
+    def _print_briefing_summary(self, view: BriefingView, scenario: MockScenario):
+        """Print a formatted summary of the AI briefing (as one write, after the success line)."""
+        lines = [
+            "✅ AI briefing generated successfully!",
+            f"\n📋 AI BRIEFING SUMMARY for {scenario.contact_name} at {scenario.company_name}",
+            _SUMMARY_RULE
+        ]
         
         # Company Profile
-        if isinstance(briefing.get("company_profile"), dict):
-            profile = briefing["company_profile"]
-            print(f"🏢 Company: {profile.get('name', scenario.company_name)}")
-            print(f"📊 Industry: {profile.get('industry', scenario.industry)}")
-            print(f"📝 Overview: {profile.get('description', 'N/A')[:100]}...")
+        profile = view.profile
+        if isinstance(profile, dict):
+            lines.append(f"🏢 Company: {profile.get('name', scenario.company_name)}")
+            lines.append(f"📊 Industry: {profile.get('industry', scenario.industry)}")
+            lines.append(f"📝 Overview: {profile.get('description', 'N/A')[:100]}...")
         else:
-            print(f"🏢 Company Profile: {str(briefing.get('company_profile', 'N/A'))[:100]}...")
+            lines.append(f"🏢 Company Profile: {str(profile or 'N/A')[:100]}...")
         
         # Key Updates
-        updates = briefing.get("key_updates", [])
-        print(f"\n📰 Recent Updates ({len(updates)}):")
+        updates = view.updates
+        lines.append(f"\n📰 Recent Updates ({len(updates)}):")
         for i, update in enumerate(updates[:3], 1):
             update_text = update if isinstance(update, str) else str(update)
-            print(f"  {i}. {update_text[:80]}...")
+            lines.append(f"  {i}. {update_text[:80]}...")
         
         # Lead Angle
-        angle = briefing.get("lead_angle", "")
-        print(f"\n🎯 Sales Angle: {angle[:100]}...")
+        lines.append(f"\n🎯 Sales Angle: {view.angle[:100]}...")
         
         # Conversation Starters
-        starters = briefing.get("conversation_starters", [])
-        print(f"\n💬 Conversation Starters ({len(starters)}):")
+        starters = view.starters
+        lines.append(f"\n💬 Conversation Starters ({len(starters)}):")
         for i, starter in enumerate(starters[:2], 1):
-            print(f"  {i}. {starter}")
+            lines.append(f"  {i}. {starter}")
+        
+        print("\n".join(lines))
     
     async def run_comparison_test(self, scenario: MockScenario) -> Dict[str, Any]:
         """Run both cold calling and AI briefing approaches for comparison."""
-        print(f"\n{'🔬 TESTING SCENARIO: ' + scenario.scenario_description.upper():=^80}")
-        print(f"Lead: {scenario.contact_name} ({scenario.contact_role}) at {scenario.company_name}")
-        print(f"Source: {scenario.lead_source}")
-        print(f"Industry: {scenario.industry} | Size: {scenario.company_size}")
+        print("\n".join((
+            f"\n{'🔬 TESTING SCENARIO: ' + scenario.scenario_description.upper():=^80}",
+            f"Lead: {scenario.contact_name} ({scenario.contact_role}) at {scenario.company_name}",
+            f"Source: {scenario.lead_source}",
+            f"Industry: {scenario.industry} | Size: {scenario.company_size}"
+        )))
         
         # Test both approaches
         cold_result = await self.test_cold_calling_approach(scenario)
@@ -341,48 +492,40 @@ class MockSalesScenarioTester:
         if not ai_result.get("briefing_generated"):
             return {"error": "Could not generate AI briefing for comparison"}
         
-        # Extract close probabilities (convert percentages to numbers)
-        cold_close_prob = 15  # From cold calling example
-        ai_close_prob = 65    # Based on AI briefing quality
-        
+        # Only the preparation time depends on the run; the rest is fixed
         return {
-            "close_probability_improvement": f"{ai_close_prob - cold_close_prob}% increase",
+            "close_probability_improvement": _CLOSE_PROBABILITY_IMPROVEMENT,
             "preparation_time_investment": f"{ai_result.get('preparation_time', 0):.1f} seconds",
-            "roi_on_preparation": f"{(ai_close_prob / cold_close_prob - 1) * 100:.0f}% improvement",
-            "professionalism_boost": "High - Shows research and preparation",
-            "relationship_building": "Excellent - Personalized approach builds trust",
-            "competitive_differentiation": "Strong - Stands out from generic competitors",
-            "key_advantages": [
-                f"Company-specific insights vs generic pitch",
-                f"Targeted conversation starters vs feature dumping", 
-                f"Proactive objection handling vs reactive responses",
-                f"Professional preparation vs winging it"
-            ]
+            **_STATIC_IMPROVEMENTS
         }
     
     async def run_all_scenarios(self) -> Dict[str, Any]:
         """Run comparison tests for all scenarios."""
-        print("🚀 STARTING COMPREHENSIVE SALES APPROACH COMPARISON")
-        print("="*80)
-        print("Testing AI-Powered Sales Briefings vs Traditional Cold Calling")
-        print("Based on the 'Bella Vista Café' cold calling example")
-        print("="*80)
+        print(_RUN_BANNER)
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         results = []
         
+        # Start every webhook call up front so briefings generate concurrently;
+        # the comparisons below still run and print one scenario at a time
+        self._webhook_requests = {
+            scenario.lead_id: asyncio.create_task(self._post_webhook(scenario))
+            for scenario in self.scenarios
+        }
+        
         for scenario in self.scenarios:
             try:
                 result = await self.run_comparison_test(scenario)
                 results.append(result)
                 
-                # Add delay between tests to avoid overwhelming the API
-                await asyncio.sleep(1)
-                
             except Exception as e:
                 print(f"❌ Error testing {scenario.company_name}: {str(e)}")
         
-        total_time = time.time() - start_time
+        for request in self._webhook_requests.values():
+            request.cancel()
+        self._webhook_requests.clear()
+        
+        total_time = _elapsed_ms(start_ns) / 1000
         
         # Generate comprehensive summary
         summary = self._generate_comprehensive_summary(results, total_time)
@@ -395,13 +538,21 @@ class MockSalesScenarioTester:
     
     def _generate_comprehensive_summary(self, results: List[Dict], total_time: float) -> Dict[str, Any]:
         """Generate comprehensive summary of all test results."""
-        successful_tests = len([r for r in results if r.get("ai_briefing_result", {}).get("briefing_generated")])
+        # One pass over the results for both the success count and briefing times
+        successful_tests = 0
+        total_briefing_time = 0
+        for result in results:
+            ai_result = result.get("ai_briefing_result", _EMPTY_RESULT)
+            if ai_result.get("briefing_generated"):
+                successful_tests += 1
+            total_briefing_time += ai_result.get("preparation_time", 0)
+        average_briefing_time = total_briefing_time / len(results) if results else 0.0
         
         return {
             "total_scenarios_tested": len(results),
             "successful_ai_briefings": successful_tests,
             "total_test_time": f"{total_time:.1f} seconds",
-            "average_briefing_time": f"{sum(r.get('ai_briefing_result', {}).get('preparation_time', 0) for r in results) / len(results):.1f} seconds",
+            "average_briefing_time": f"{average_briefing_time:.1f} seconds",
             "value_proposition": {
                 "cold_calling_problems": [
                     "No company research",
@@ -431,63 +582,63 @@ class MockSalesScenarioTester:
     def print_final_summary(self, results: Dict[str, Any]):
         """Print comprehensive final summary."""
         summary = results["test_summary"]
+        impact = summary["business_impact"]
+        
+        lines = [
+            _FINAL_RESULTS_RULE,
+            f"Scenarios Tested: {summary['total_scenarios_tested']}",
+            f"Successful AI Briefings: {summary['successful_ai_briefings']}",
+            f"Total Test Time: {summary['total_test_time']}",
+            f"Average Briefing Generation: {summary['average_briefing_time']}",
+            
+            _BUSINESS_IMPACT_RULE,
+            f"Close Rate Improvement: {impact['expected_close_rate_improvement']}",
+            f"Call Quality: {impact['call_quality_improvement']}",
+            f"Relationship Building: {impact['relationship_building']}",
+            f"Competitive Position: {impact['competitive_advantage']}",
+            
+            _TRANSFORMATION_RULE,
+            "BEFORE (Cold Calling):"
+        ]
+        lines.extend(f"  ❌ {problem}" for problem in summary["value_proposition"]["cold_calling_problems"])
         
-        print(f"\n{'🏆 FINAL COMPARISON RESULTS':=^80}")
-        print(f"Scenarios Tested: {summary['total_scenarios_tested']}")
-        print(f"Successful AI Briefings: {summary['successful_ai_briefings']}")
-        print(f"Total Test Time: {summary['total_test_time']}")
-        print(f"Average Briefing Generation: {summary['average_briefing_time']}")
+        lines.append("\nAFTER (AI-Powered Briefings):")
+        lines.extend(f"  ✅ {advantage}" for advantage in summary["value_proposition"]["ai_briefing_advantages"])
         
-        print(f"\n{'💥 BUSINESS IMPACT':=^80}")
-        impact = summary["business_impact"]
-        print(f"Close Rate Improvement: {impact['expected_close_rate_improvement']}")
-        print(f"Call Quality: {impact['call_quality_improvement']}")
-        print(f"Relationship Building: {impact['relationship_building']}")
-        print(f"Competitive Position: {impact['competitive_advantage']}")
-        
-        print(f"\n{'🔥 THE TRANSFORMATION':=^80}")
-        print("BEFORE (Cold Calling):")
-        for problem in summary["value_proposition"]["cold_calling_problems"]:
-            print(f"  ❌ {problem}")
-        
-        print("\nAFTER (AI-Powered Briefings):")
-        for advantage in summary["value_proposition"]["ai_briefing_advantages"]:
-            print(f"  ✅ {advantage}")
-        
-        print(f"\n{'=' * 80}")
-        print("🎯 CONCLUSION: AI briefings transform generic cold calls into personalized,")
-        print("   professional sales conversations that build relationships and close deals.")
-        print("=" * 80)
+        lines.append(_CONCLUSION)
+        print("\n".join(lines))
 
 async def main():
     """Main entry point for mock sales scenario testing."""
-    print("🎭 Mock Sales Scenarios - AI Briefing vs Cold Calling")
-    print("Based on real webhook testing with live AI briefing generation")
-    print()
+    print(
+        "🎭 Mock Sales Scenarios - AI Briefing vs Cold Calling\n"
+        "Based on real webhook testing with live AI briefing generation\n"
+    )
     
-    # Check if server is running
-    tester = MockSalesScenarioTester()
-    
-    try:
-        response = requests.get(f"{tester.base_url}/", timeout=5)
-        if response.status_code == 200:
-            print("✅ AI Briefing API is running")
-        else:
-            print("⚠️ API responding but with issues")
-    except:
-        print("❌ ERROR: Please start the server first:")
-        print("   uvicorn main:app --reload")
-        return
-    
-    # Run comprehensive testing
-    results = await tester.run_all_scenarios()
-    
-    # Print final summary
-    tester.print_final_summary(results)
+    async with MockSalesScenarioTester() as tester:
+        # Check if server is running
+        try:
+            response = await tester._client.get("/", timeout=_HEALTH_CHECK_TIMEOUT)
+            if response.status_code == 200:
+                print("✅ AI Briefing API is running")
+            else:
+                print("⚠️ API responding but with issues")
+        except:
+            print("❌ ERROR: Please start the server first:\n   uvicorn main:app --reload")
+            return
+        
+        # Run comprehensive testing on already-open connections
+        await tester.warmup()
+        results = await tester.run_all_scenarios()
+        
+        # Print final summary
+        tester.print_final_summary(results)
     
     # Optionally save results to file
-    with open("sales_comparison_results.json", "w") as f:
-        json.dump(results, f, indent=2, default=str)
+    # Scenario dataclasses serialize natively; default=str is only a fallback
+    Path("sales_comparison_results.json").write_bytes(
+        orjson.dumps(results, option=orjson.OPT_INDENT_2, default=str)
+    )
     
     print(f"\n📄 Detailed results saved to: sales_comparison_results.json")
 
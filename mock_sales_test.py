@@ -8,9 +8,9 @@ example) to AI-powered personalized sales conversations using real webhook testi
 
 import asyncio
 import json
-import requests
+import httpx
 import time
-from typing import Dict, List, Any
+from typing import Awaitable, Dict, List, Any, Tuple
 
 class MockSalesTest:
     """Test AI briefings vs cold calling approaches."""
@@ -66,29 +66,28 @@ class MockSalesTest:
         print("  • Relationship building: None")
         print("  • Prospect feeling: 'Just another sales call'")
     
-    async def test_ai_briefing(self, scenario: Dict) -> Dict[str, Any]:
-        """Test AI briefing generation for the scenario."""
+    async def _post_webhook(self, client: httpx.AsyncClient, scenario: Dict) -> Tuple[httpx.Response, float]:
+        """Make the real API call to generate a briefing; returns the response and its duration."""
+        webhook_data = {
+            "company_domain": scenario["company_domain"],
+            "context_id": scenario["context_id"], 
+            "lead_id": scenario["lead_id"]
+        }
+        start_time = time.time()
+        response = await client.post("/webhook", json=webhook_data)
+        return response, time.time() - start_time
+    
+    async def test_ai_briefing(self, scenario: Dict, webhook_call: Awaitable[Tuple[httpx.Response, float]]) -> Dict[str, Any]:
+        """Test AI briefing generation for the scenario.
+        
+        ``webhook_call`` is the scenario's (possibly already running) _post_webhook call.
+        """
         print(f"\n🚀 AI-POWERED APPROACH: {scenario['company_name']}")
         print("="*60)
         
         try:
-            # Make real API call to generate briefing
-            webhook_data = {
-                "company_domain": scenario["company_domain"],
-                "context_id": scenario["context_id"], 
-                "lead_id": scenario["lead_id"]
-            }
-            
             print(f"📡 Generating AI briefing for {scenario['contact_name']}...")
-            start_time = time.time()
-            
-            response = requests.post(
-                f"{self.base_url}/webhook",
-                json=webhook_data,
-                timeout=30
-            )
-            
-            processing_time = time.time() - start_time
+            response, processing_time = await webhook_call
             
             if response.status_code == 200:
                 briefing_data = response.json()
@@ -162,21 +161,39 @@ class MockSalesTest:
         print("Based on your 'Bella Vista Café' cold calling example")
         print("="*80)
         
-        # Check if server is running
-        try:
-            response = requests.get(f"{self.base_url}/", timeout=5)
-            if response.status_code == 200:
-                print("✅ AI Briefing API is running")
-            else:
-                print("⚠️ API responding but with issues")
-        except:
-            print("❌ ERROR: Please start the server first:")
-            print("   uvicorn main:app --reload")
-            return
+        async with httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=8)
+        ) as client:
+            # Check if server is running
+            try:
+                response = await client.get("/", timeout=5.0)
+                if response.status_code == 200:
+                    print("✅ AI Briefing API is running")
+                else:
+                    print("⚠️ API responding but with issues")
+            except:
+                print("❌ ERROR: Please start the server first:")
+                print("   uvicorn main:app --reload")
+                return
+            
+            # Start every briefing now so they generate concurrently; the
+            # scenarios below still print one at a time, in order
+            webhook_calls = [
+                asyncio.create_task(self._post_webhook(client, scenario))
+                for scenario in self.scenarios
+            ]
+            results = await self._present_scenarios(webhook_calls)
         
+        # Final summary
+        self.print_final_summary(results)
+    
+    async def _present_scenarios(self, webhook_calls: List[asyncio.Task]) -> List[Dict]:
+        """Walk through each scenario, using its already-started briefing call."""
         results = []
         
-        for scenario in self.scenarios:
+        for scenario, webhook_call in zip(self.scenarios, webhook_calls):
             print(f"\n{'📋 SCENARIO: ' + scenario['company_name'].upper():=^80}")
             print(f"Contact: {scenario['contact_name']} | Industry: {scenario['industry']}")
             print(f"Lead Source: {scenario['lead_source']}")
@@ -185,7 +202,7 @@ class MockSalesTest:
             self.show_cold_calling_problems(scenario)
             
             # Test AI briefing approach
-            ai_result = await self.test_ai_briefing(scenario)
+            ai_result = await self.test_ai_briefing(scenario, webhook_call)
             
             results.append({
                 "scenario": scenario,
@@ -200,12 +217,8 @@ class MockSalesTest:
                 print("RESULT: 4X improvement in sales effectiveness!")
             
             print("\n" + "="*80)
-            
-            # Pause between scenarios
-            await asyncio.sleep(2)
         
-        # Final summary
-        self.print_final_summary(results)
+        return results
     
     def print_final_summary(self, results: List[Dict]):
         """Print final comparison summary."""
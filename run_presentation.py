@@ -7,16 +7,7 @@ Easy-to-use launcher for stakeholder presentations with multiple demo options.
 
 import sys
 import time
-import requests
-from stakeholder_demo import StakeholderDemo
-
-def check_system_status():
-    """Check if the AI system is running."""
-    try:
-        response = requests.get("http://localhost:8000/", timeout=5)
-        return response.status_code == 200
-    except:
-        return False
+from stakeholder_demo import StakeholderDemo, check_system_status
 
 def main():
     """Main presentation launcher."""
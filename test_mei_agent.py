@@ -0,0 +1,184 @@
+"""
+Unit tests for the Mei chat agent.
+
+Groq is mocked throughout: tests patch ``groq_client`` so the AI paths run and
+replace ``groq_completion`` so no request leaves the process.
+"""
+
+import asyncio
+import time
+import pytest
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+from fastapi.testclient import TestClient
+
+import mei_agent
+from mei_agent import (
+    app, ChatMessage, ChatSession, LeadStatus, chat_sessions,
+    HISTORY_MAX_MESSAGES, HISTORY_COMPACT_MESSAGES,
+    _compact_history, _background_tasks, get_mei_system_prompt,
+    generate_dynamic_quick_replies
+)
+
+# Test client for FastAPI endpoints
+client = TestClient(app)
+
+# === FIXTURES ===
+
+def make_session(session_id: str, message_count: int) -> ChatSession:
+    """Build a chat session holding message_count numbered messages."""
+    session = ChatSession(
+        session_id=session_id,
+        lead_status=LeadStatus(),
+        created_at=datetime.now(),
+        updated_at=datetime.now()
+    )
+    for i in range(message_count):
+        role = "user" if i % 2 == 0 else "assistant"
+        session.conversation_history.append(ChatMessage(role=role, content=f"message {i}", timestamp=time.time()))
+    return session
+
+def groq_reply(content: str) -> SimpleNamespace:
+    """Mock Groq chat completion carrying content as its only choice."""
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+@pytest.fixture
+def paged_session():
+    """Session with five messages registered in the session store."""
+    session = make_session("paged", 5)
+    chat_sessions[session.session_id] = session
+    yield session
+    chat_sessions.pop(session.session_id, None)
+
+@pytest.fixture
+def mock_groq_client():
+    """Mark Groq as configured so the AI code paths run."""
+    with patch.object(mei_agent, "groq_client", Mock()):
+        yield
+
+class TestSessionInfoPagination:
+    """Test cases for GET /api/session/{session_id} pagination."""
+
+    def test_default_returns_full_history(self, paged_session):
+        """Test no offset or limit returns every message."""
+        response = client.get("/api/session/paged")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_messages"] == 5
+        assert [msg["content"] for msg in data["conversation_history"]] == [f"message {i}" for i in range(5)]
+
+    def test_offset_and_limit_window(self, paged_session):
+        """Test offset and limit select a window of the history."""
+        response = client.get("/api/session/paged", params={"offset": 1, "limit": 2})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_messages"] == 5
+        assert [msg["content"] for msg in data["conversation_history"]] == ["message 1", "message 2"]
+
+    def test_offset_past_end_is_empty(self, paged_session):
+        """Test an offset beyond the history returns no messages."""
+        response = client.get("/api/session/paged", params={"offset": 10})
+
+        assert response.status_code == 200
+        assert response.json()["conversation_history"] == []
+
+    @pytest.mark.parametrize("params", [{"offset": -1}, {"limit": -1}, {"limit": 0}])
+    def test_invalid_pagination_rejected(self, paged_session, params):
+        """Test negative offsets and non-positive limits are rejected."""
+        response = client.get("/api/session/paged", params=params)
+
+        assert response.status_code == 422
+
+    def test_unknown_session(self):
+        """Test an unknown session returns 404."""
+        response = client.get("/api/session/no-such-session")
+
+        assert response.status_code == 404
+
+class TestHistoryCompaction:
+    """Test cases for folding long histories into the running summary."""
+
+    @pytest.mark.asyncio
+    async def test_history_kept_until_summary_lands(self, mock_groq_client):
+        """Test compacted messages stay in the history and prompt until summarised."""
+        session = make_session("compact", HISTORY_MAX_MESSAGES + 1)
+        release = asyncio.Event()
+
+        async def slow_summary(**kwargs):
+            await release.wait()
+            return groq_reply("Owner of a cafe in Penang.")
+
+        with patch.object(mei_agent, "groq_completion", AsyncMock(side_effect=slow_summary)):
+            _compact_history(session)
+
+            assert session.summary_pending
+            assert len(session.conversation_history) == HISTORY_MAX_MESSAGES + 1
+            assert "message 0" in get_mei_system_prompt(session)
+
+            release.set()
+            await asyncio.gather(*_background_tasks)
+
+        assert not session.summary_pending
+        assert session.running_summary == "Owner of a cafe in Penang."
+        assert len(session.conversation_history) == HISTORY_MAX_MESSAGES + 1 - HISTORY_COMPACT_MESSAGES
+        assert session.conversation_history[0].content == f"message {HISTORY_COMPACT_MESSAGES}"
+
+    @pytest.mark.asyncio
+    async def test_failed_summary_keeps_history(self, mock_groq_client):
+        """Test a failed summary call loses no messages."""
+        session = make_session("compact-fail", HISTORY_MAX_MESSAGES + 1)
+
+        with patch.object(mei_agent, "groq_completion", AsyncMock(side_effect=RuntimeError("Groq down"))):
+            _compact_history(session)
+            await asyncio.gather(*_background_tasks)
+
+        assert not session.summary_pending
+        assert session.running_summary == ""
+        assert len(session.conversation_history) == HISTORY_MAX_MESSAGES + 1
+
+    @pytest.mark.asyncio
+    async def test_short_history_not_compacted(self, mock_groq_client):
+        """Test histories within the limit make no summary call."""
+        session = make_session("compact-short", HISTORY_MAX_MESSAGES)
+
+        with patch.object(mei_agent, "groq_completion", AsyncMock()) as mock_completion:
+            _compact_history(session)
+
+        mock_completion.assert_not_called()
+        assert not session.summary_pending
+
+class TestQuickReplyFallback:
+    """Test cases for routing to contextual quick replies when Groq can't answer."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("mei_message, expected", [
+        ("Where is your shop located?", ("Kuala Lumpur area", "Selangor, Malaysia", "Petaling Jaya")),
+        ("Would you like to book a few meetings?", ("Yes, show demo", "Can we meet?", "Online demo preferred")),
+        ("What's your budget for this?", ("What's monthly cost?", "Budget under RM500", "Need affordable option")),
+        ("Lovely, thanks!", ("Tell me more", "I'm interested", "Show me options")),
+    ])
+    async def test_groq_error_routes_fallback(self, mock_groq_client, mei_message, expected):
+        """Test a Groq error falls back to replies routed on Mei's message."""
+        with patch.object(mei_agent, "groq_completion", AsyncMock(side_effect=RuntimeError("Groq down"))):
+            replies = await generate_dynamic_quick_replies(mei_message, "unknown-lead")
+
+        assert replies == expected
+
+    @pytest.mark.asyncio
+    async def test_invalid_json_routes_fallback(self, mock_groq_client):
+        """Test replies that fail the JSON schema fall back to routed replies."""
+        with patch.object(mei_agent, "groq_completion", AsyncMock(return_value=groq_reply('{"replies": ["Only one"]}'))):
+            replies = await generate_dynamic_quick_replies("Are you showing this to the owner?", "unknown-lead")
+
+        assert replies == ("Yes, I'm the owner", "I'm the manager", "I make decisions")
+
+    @pytest.mark.asyncio
+    async def test_without_groq_routes_fallback(self):
+        """Test an unconfigured Groq client uses routed replies directly."""
+        with patch.object(mei_agent, "groq_client", None):
+            replies = await generate_dynamic_quick_replies("Have you seen our demos?", "unknown-lead")
+
+        assert replies == ("Yes, show demo", "Can we meet?", "Online demo preferred")
@@ -0,0 +1,114 @@
+"""
+Unit tests for the fallback quick-reply routing in mock_leads_data.
+"""
+
+import pytest
+
+from mock_leads_data import (
+    BUSINESS_INTELLIGENCE, MOCK_LEADS_DATA,
+    get_contextual_quick_replies, get_most_urgent_leads, _question_category
+)
+
+# The original if/elif substring checks, in their priority order
+BASELINE_CUES = (
+    ("business_type", ("business", "industry", "type", "running", "what do you")),
+    ("location", ("location", "where", "based", "operating")),
+    ("role", ("owner", "manager", "decision", "charge", "responsible")),
+    ("current_system", ("current", "system", "problem", "challenge", "difficulty", "pos", "setup")),
+    ("goals", ("achieve", "looking", "hoping", "goal", "improve", "want")),
+    ("team_size", ("staff", "employee", "team", "people", "work")),
+    ("sales_volume", ("sales", "customer", "daily", "volume", "busy")),
+    ("timeline", ("when", "timeline", "urgent", "soon", "planning")),
+    ("budget", ("budget", "cost", "price", "afford", "expensive")),
+    ("demo", ("demo", "meeting", "show", "presentation", "see how")),
+    ("features", ("feature", "function", "integrate", "support")),
+)
+
+def baseline_category(message):
+    """Category the original substring checks picked for message."""
+    mei_lower = message.lower()
+    for category, cues in BASELINE_CUES:
+        if any(cue in mei_lower for cue in cues):
+            return category
+    return None
+
+class TestQuestionRouting:
+    """Test cases for routing Mei's questions to quick-reply categories."""
+
+    @pytest.mark.parametrize("message, expected", [
+        ("What type of business are you running?", "business_type"),
+        ("Where are you based?", "location"),
+        ("Are you the owners?", "role"),
+        ("Any challenges with your current systems?", "current_system"),
+        ("What improvement are you after?", "goals"),
+        ("How many employees work there?", "team_size"),
+        ("How busy are your daily sales?", "sales_volume"),
+        ("When are you planning to open?", "timeline"),
+        ("What does it cost?", "budget"),
+        ("Shall we set up a few meetings?", "demo"),
+        ("Have you seen our demos?", "demo"),
+        ("We'll be showing you the dashboard", "demo"),
+        ("Would you like to see how we can help?", "demo"),
+        ("Should it be integrated with your accounting?", "features"),
+        ("Sounds good.", None),
+    ])
+    def test_question_category(self, message, expected):
+        """Test keywords match as word prefixes, covering their inflections."""
+        assert _question_category(message) == expected
+
+    @pytest.mark.parametrize("message, expected", [
+        ("Would you like a demonstration?", "demo"),
+        ("Is it affordable for you?", "budget"),
+        ("Which functionality matters most?", "features"),
+        ("Do you need this urgently?", "timeline"),
+        ("Shall I showcase it?", "demo"),
+        ("The position is filled", "current_system"),
+    ])
+    def test_baseline_prefix_parity(self, message, expected):
+        """Test longer words routed by the original substring checks still route."""
+        assert _question_category(message) == expected
+
+    @pytest.mark.parametrize("message", [
+        "Where are you based? Let's see how we can help.",
+        "Would you like to see how it works?",
+        "What do you sell, and when do you open?",
+        "Let's see how your team handles the lunch rush",
+        "Are you hoping to see how it handles pricing?",
+        "Can I show you how the kitchen display supports your staff?",
+    ])
+    def test_baseline_priority_parity(self, message):
+        """Test phrase cues rank with their category, as in the original checks."""
+        assert _question_category(message) == baseline_category(message)
+
+    def test_category_replies_returned(self):
+        """Test a routed question returns that category's replies."""
+        replies = get_contextual_quick_replies("unknown-lead", "Would you like a demo?")
+
+        assert replies == ("Yes, show demo", "Can we meet?", "Online demo preferred")
+
+    def test_unrouted_message_falls_back(self):
+        """Test a message with no cue falls back to the unknown-lead replies."""
+        replies = get_contextual_quick_replies("unknown-lead", "Sounds good.")
+
+        assert replies == ("Tell me more", "I'm interested", "Show me options")
+
+class TestMostUrgentLeads:
+    """Test cases for ranking leads by business-intel urgency."""
+
+    def urgency(self, lead):
+        """Business-intel urgency label for a lead."""
+        return BUSINESS_INTELLIGENCE[lead["company_name"]]["urgency"]
+
+    def test_immediate_leads_first(self):
+        """Test the top leads are the Immediate ones, in lead order."""
+        immediate = [lead for lead in MOCK_LEADS_DATA if self.urgency(lead) == "Immediate"]
+
+        assert get_most_urgent_leads(len(immediate)) == immediate
+
+    def test_ranked_by_urgency(self):
+        """Test every lead is returned, ordered Immediate, High, Medium, Low."""
+        order = {"Immediate": 0, "High": 1, "Medium": 2, "Low": 3}
+        ranked = get_most_urgent_leads(len(MOCK_LEADS_DATA))
+
+        assert len(ranked) == len(MOCK_LEADS_DATA)
+        assert [order[self.urgency(lead)] for lead in ranked] == sorted(order[self.urgency(lead)] for lead in MOCK_LEADS_DATA)